@@ -16,7 +16,7 @@ from .settings import Settings, update_settings
 from .auto_loader import load_all_geolipi_nodes, load_all_sysl_nodes, load_all_symbolic_nodes
 
 # Node inspection utilities
-from .inspect_nodes import inspect_node, list_nodes, search_nodes
+from .inspect_nodes import inspect_node, inspect_node_str, list_nodes, search_nodes
 
 # Converter utilities
 from . import converter
@@ -37,7 +37,7 @@ __all__ = [
     # Auto-loader
     "load_all_geolipi_nodes", "load_all_sysl_nodes", "load_all_symbolic_nodes",
     # Node inspection
-    "inspect_node", "list_nodes", "search_nodes",
+    "inspect_node", "inspect_node_str", "list_nodes", "search_nodes",
     # Converter
     "converter",
     # Custom nodes
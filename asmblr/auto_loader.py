@@ -48,6 +48,9 @@ def _check_migumi_available() -> bool:
 
 MIGUMI_AVAILABLE = _check_migumi_available()
 
+# Node names registered by load_all_symbolic_nodes, once it has run
+_loaded_symbolic_nodes: Optional[List[str]] = None
+
 # Symbols we exclude from auto-generation; implemented manually elsewhere
 EXCLUDE_SYMBOLS = {
     'VarSplitter',
@@ -233,7 +236,12 @@ def load_all_symbolic_nodes() -> List[str]:
     
     Returns:
         List of all registered node names.
+    
+    Loading is done once per process; later calls return the same names.
     """
+    global _loaded_symbolic_nodes
+    if _loaded_symbolic_nodes is not None:
+        return list(_loaded_symbolic_nodes)
     all_nodes = []
     
     # Required: GeoLIPI nodes
@@ -260,6 +268,7 @@ def load_all_symbolic_nodes() -> List[str]:
     #     parsel_nodes = load_all_parsel_nodes()
     #     all_nodes.extend(parsel_nodes)
     
+    _loaded_symbolic_nodes = list(all_nodes)
     return all_nodes
 
 
@@ -383,7 +392,7 @@ def _collect_module_nodes(module_dict) -> List[Dict]:
 
         arg_keys = list(spec.keys())
         arg_types = {k: (v.get("type", "") if isinstance(v, dict) else "") for k, v in spec.items()}
-        is_variadic = any(isinstance(v, dict) and (v.get("variadic", False) or v.get("variadic", False)) for v in spec.values())
+        is_variadic = any(isinstance(v, dict) and v.get("variadic", False) for v in spec.values())
         
         # Extract default values from spec
         default_values = {}
@@ -419,7 +428,7 @@ def _generate_file_content(all_node_info: List[Dict], library_name: str) -> str:
     """Generate the Python file content for all nodes."""
     
     # File header
-    content = f'''"""
+    parts = [f'''"""
 Auto-generated {library_name} nodes for ASMBLR.
 
 This file is automatically generated by asmblr.auto_loader.
@@ -428,28 +437,27 @@ Do not edit this file manually - regenerate it instead.
 
 from typing import List
 from ..expr_node import GLNode
-from ..base import InputSocket
 from ..simple_registry import register_node_decorator
 
 
-'''
+''']
     
     # Generate node classes
     for node_info in all_node_info:
-        content += _generate_node_class(node_info)
-        content += "\n\n"
+        parts.append(_generate_node_class(node_info))
+        parts.append("\n\n")
     
     # Generate registration function
-    content += "def register_all_nodes() -> List[str]:\n"
-    content += f'    """Return list of all auto-registered {library_name} nodes."""\n'
-    content += "    # All nodes are registered via the @register_node_decorator\n"
-    content += "    return [\n"
+    parts.append("def register_all_nodes() -> List[str]:\n")
+    parts.append(f'    """Return list of all auto-registered {library_name} nodes."""\n')
+    parts.append("    # All nodes are registered via the @register_node_decorator\n")
+    parts.append("    return [\n")
     for node_info in all_node_info:
         node_name = node_info['name']
-        content += f'        "{node_name}",\n'
-    content += "    ]\n"
+        parts.append(f'        "{node_name}",\n')
+    parts.append("    ]\n")
     
-    return content
+    return "".join(parts)
 
 
 def _generate_node_class(node_info: Dict) -> str:
@@ -476,18 +484,11 @@ class {name}(GLNode):
     # Embed category metadata in the class
     node_category = "{category}"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for {name}."""
-        self.arg_keys = {repr(arg_keys)}
-        self.default_values = {repr(default_values)}
-        self.is_variadic = {is_variadic}
-        self.arg_types = {repr(arg_types)}
-        return {{key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}}'''
+    # Socket metadata, shared by all instances
+    arg_keys = {repr(arg_keys)}
+    default_values = {repr(default_values)}
+    is_variadic = {is_variadic}
+    arg_types = {repr(arg_types)}'''
     
     return class_def
 
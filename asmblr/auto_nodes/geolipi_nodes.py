@@ -7,7 +7,6 @@ Do not edit this file manually - regenerate it instead.
 
 from typing import List
 from ..expr_node import GLNode
-from ..base import InputSocket
 from ..simple_registry import register_node_decorator
 
 
@@ -21,18 +20,11 @@ class Arc2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Arc2D."""
-        self.arg_keys = ['angle', 'ra', 'rb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'angle': 'float', 'ra': 'float', 'rb': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['angle', 'ra', 'rb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'angle': 'float', 'ra': 'float', 'rb': 'float'}
 
 @register_node_decorator
 class BlobbyCross2D(GLNode):
@@ -44,18 +36,11 @@ class BlobbyCross2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for BlobbyCross2D."""
-        self.arg_keys = ['he']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'he': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['he']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'he': 'float'}
 
 @register_node_decorator
 class Box2D(GLNode):
@@ -67,18 +52,11 @@ class Box2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Box2D."""
-        self.arg_keys = ['size']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'size': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['size']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'size': 'Vector[2]'}
 
 @register_node_decorator
 class Circle2D(GLNode):
@@ -90,18 +68,11 @@ class Circle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Circle2D."""
-        self.arg_keys = ['radius']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'radius': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['radius']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'radius': 'float'}
 
 @register_node_decorator
 class CircleWave2D(GLNode):
@@ -113,18 +84,11 @@ class CircleWave2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CircleWave2D."""
-        self.arg_keys = ['tb', 'ra']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'tb': 'float', 'ra': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['tb', 'ra']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'tb': 'float', 'ra': 'float'}
 
 @register_node_decorator
 class CoolS2D(GLNode):
@@ -136,18 +100,11 @@ class CoolS2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CoolS2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class Cross2D(GLNode):
@@ -159,18 +116,11 @@ class Cross2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Cross2D."""
-        self.arg_keys = ['b', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'b': 'Vector[2]', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['b', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'b': 'Vector[2]', 'r': 'float'}
 
 @register_node_decorator
 class CutDisk2D(GLNode):
@@ -182,18 +132,11 @@ class CutDisk2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CutDisk2D."""
-        self.arg_keys = ['r', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float', 'h': 'float'}
 
 @register_node_decorator
 class Egg2D(GLNode):
@@ -205,18 +148,11 @@ class Egg2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Egg2D."""
-        self.arg_keys = ['ra', 'rb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'ra': 'float', 'rb': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['ra', 'rb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'ra': 'float', 'rb': 'float'}
 
 @register_node_decorator
 class Ellipse2D(GLNode):
@@ -228,18 +164,11 @@ class Ellipse2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Ellipse2D."""
-        self.arg_keys = ['ab']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'ab': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['ab']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'ab': 'Vector[2]'}
 
 @register_node_decorator
 class EquilateralTriangle2D(GLNode):
@@ -251,18 +180,11 @@ class EquilateralTriangle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for EquilateralTriangle2D."""
-        self.arg_keys = ['side_length']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'side_length': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['side_length']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'side_length': 'float'}
 
 @register_node_decorator
 class Heart2D(GLNode):
@@ -274,18 +196,11 @@ class Heart2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Heart2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class Hexagram2D(GLNode):
@@ -297,18 +212,11 @@ class Hexagram2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Hexagram2D."""
-        self.arg_keys = ['r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float'}
 
 @register_node_decorator
 class HorseShoe2D(GLNode):
@@ -320,18 +228,11 @@ class HorseShoe2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for HorseShoe2D."""
-        self.arg_keys = ['angle', 'r', 'w']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'angle': 'float', 'r': 'float', 'w': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['angle', 'r', 'w']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'angle': 'float', 'r': 'float', 'w': 'Vector[2]'}
 
 @register_node_decorator
 class Hyperbola2D(GLNode):
@@ -343,18 +244,11 @@ class Hyperbola2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Hyperbola2D."""
-        self.arg_keys = ['k', 'he']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'k': 'float', 'he': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['k', 'he']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'k': 'float', 'he': 'float'}
 
 @register_node_decorator
 class InstantiatedPrim2D(GLNode):
@@ -366,18 +260,11 @@ class InstantiatedPrim2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InstantiatedPrim2D."""
-        self.arg_keys = ['primitive']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'primitive': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['primitive']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'primitive': 'str'}
 
 @register_node_decorator
 class IsoscelesTriangle2D(GLNode):
@@ -389,18 +276,11 @@ class IsoscelesTriangle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for IsoscelesTriangle2D."""
-        self.arg_keys = ['wi_hi']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'wi_hi': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['wi_hi']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'wi_hi': 'Vector[2]'}
 
 @register_node_decorator
 class Moon2D(GLNode):
@@ -412,18 +292,11 @@ class Moon2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Moon2D."""
-        self.arg_keys = ['d', 'ra', 'rb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'d': 'float', 'ra': 'float', 'rb': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['d', 'ra', 'rb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'d': 'float', 'ra': 'float', 'rb': 'float'}
 
 @register_node_decorator
 class NoParamCircle2D(GLNode):
@@ -435,18 +308,11 @@ class NoParamCircle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NoParamCircle2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class NoParamRectangle2D(GLNode):
@@ -458,18 +324,11 @@ class NoParamRectangle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NoParamRectangle2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class NoParamTriangle2D(GLNode):
@@ -481,18 +340,11 @@ class NoParamTriangle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NoParamTriangle2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class NullExpression2D(GLNode):
@@ -504,18 +356,11 @@ class NullExpression2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NullExpression2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class OrientedBox2D(GLNode):
@@ -527,18 +372,11 @@ class OrientedBox2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for OrientedBox2D."""
-        self.arg_keys = ['start_point', 'end_point', 'thickness']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'start_point': 'Vector[2]', 'end_point': 'Vector[2]', 'thickness': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['start_point', 'end_point', 'thickness']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'start_point': 'Vector[2]', 'end_point': 'Vector[2]', 'thickness': 'float'}
 
 @register_node_decorator
 class OrientedVesica2D(GLNode):
@@ -550,18 +388,11 @@ class OrientedVesica2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for OrientedVesica2D."""
-        self.arg_keys = ['a', 'b', 'w']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[2]', 'b': 'Vector[2]', 'w': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'w']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[2]', 'b': 'Vector[2]', 'w': 'float'}
 
 @register_node_decorator
 class Parabola2D(GLNode):
@@ -573,18 +404,11 @@ class Parabola2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Parabola2D."""
-        self.arg_keys = ['k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'k': 'float'}
 
 @register_node_decorator
 class ParabolaSegment2D(GLNode):
@@ -596,18 +420,11 @@ class ParabolaSegment2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ParabolaSegment2D."""
-        self.arg_keys = ['wi', 'he']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'wi': 'float', 'he': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['wi', 'he']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'wi': 'float', 'he': 'float'}
 
 @register_node_decorator
 class Parallelogram2D(GLNode):
@@ -619,18 +436,11 @@ class Parallelogram2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Parallelogram2D."""
-        self.arg_keys = ['width', 'height', 'skew']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'width': 'float', 'height': 'float', 'skew': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['width', 'height', 'skew']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'width': 'float', 'height': 'float', 'skew': 'float'}
 
 @register_node_decorator
 class Pentagram2D(GLNode):
@@ -642,18 +452,11 @@ class Pentagram2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Pentagram2D."""
-        self.arg_keys = ['r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float'}
 
 @register_node_decorator
 class Pie2D(GLNode):
@@ -665,18 +468,11 @@ class Pie2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Pie2D."""
-        self.arg_keys = ['c', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'c': 'Vector[2]', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['c', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'c': 'Vector[2]', 'r': 'float'}
 
 @register_node_decorator
 class Polygon2D(GLNode):
@@ -688,18 +484,11 @@ class Polygon2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Polygon2D."""
-        self.arg_keys = ['verts']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'verts': 'List[Vector[2]]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['verts']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'verts': 'List[Vector[2]]'}
 
 @register_node_decorator
 class QuadraticBezierCurve2D(GLNode):
@@ -711,18 +500,11 @@ class QuadraticBezierCurve2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for QuadraticBezierCurve2D."""
-        self.arg_keys = ['A', 'B', 'C']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'A': 'Vector[2]', 'B': 'Vector[2]', 'C': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['A', 'B', 'C']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'A': 'Vector[2]', 'B': 'Vector[2]', 'C': 'Vector[2]'}
 
 @register_node_decorator
 class QuadraticCircle2D(GLNode):
@@ -734,18 +516,11 @@ class QuadraticCircle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for QuadraticCircle2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class Rectangle2D(GLNode):
@@ -757,18 +532,11 @@ class Rectangle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Rectangle2D."""
-        self.arg_keys = ['size']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'size': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['size']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'size': 'Vector[2]'}
 
 @register_node_decorator
 class RegularHexagon2D(GLNode):
@@ -780,18 +548,11 @@ class RegularHexagon2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RegularHexagon2D."""
-        self.arg_keys = ['r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float'}
 
 @register_node_decorator
 class RegularOctagon2D(GLNode):
@@ -803,18 +564,11 @@ class RegularOctagon2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RegularOctagon2D."""
-        self.arg_keys = ['r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float'}
 
 @register_node_decorator
 class RegularPentagon2D(GLNode):
@@ -826,18 +580,11 @@ class RegularPentagon2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RegularPentagon2D."""
-        self.arg_keys = ['r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float'}
 
 @register_node_decorator
 class RegularStar2D(GLNode):
@@ -849,18 +596,11 @@ class RegularStar2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RegularStar2D."""
-        self.arg_keys = ['r', 'n', 'm']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float', 'n': 'int', 'm': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r', 'n', 'm']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float', 'n': 'int', 'm': 'int'}
 
 @register_node_decorator
 class Rhombus2D(GLNode):
@@ -872,18 +612,11 @@ class Rhombus2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Rhombus2D."""
-        self.arg_keys = ['size']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'size': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['size']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'size': 'Vector[2]'}
 
 @register_node_decorator
 class RoundedBox2D(GLNode):
@@ -895,18 +628,11 @@ class RoundedBox2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RoundedBox2D."""
-        self.arg_keys = ['bounds', 'radius']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'bounds': 'Vector[2]', 'radius': 'Vector[4]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['bounds', 'radius']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'bounds': 'Vector[2]', 'radius': 'Vector[4]'}
 
 @register_node_decorator
 class RoundedCross2D(GLNode):
@@ -918,18 +644,11 @@ class RoundedCross2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RoundedCross2D."""
-        self.arg_keys = ['h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'float'}
 
 @register_node_decorator
 class RoundedX2D(GLNode):
@@ -941,18 +660,11 @@ class RoundedX2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RoundedX2D."""
-        self.arg_keys = ['w', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'w': 'float', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['w', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'w': 'float', 'r': 'float'}
 
 @register_node_decorator
 class Segment2D(GLNode):
@@ -964,18 +676,11 @@ class Segment2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Segment2D."""
-        self.arg_keys = ['start_point', 'end_point']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'start_point': 'Vector[2]', 'end_point': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['start_point', 'end_point']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'start_point': 'Vector[2]', 'end_point': 'Vector[2]'}
 
 @register_node_decorator
 class Stairs2D(GLNode):
@@ -987,18 +692,11 @@ class Stairs2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Stairs2D."""
-        self.arg_keys = ['wh', 'n']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'wh': 'Vector[2]', 'n': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['wh', 'n']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'wh': 'Vector[2]', 'n': 'int'}
 
 @register_node_decorator
 class TileUV2D(GLNode):
@@ -1010,18 +708,11 @@ class TileUV2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TileUV2D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class Trapezoid2D(GLNode):
@@ -1033,18 +724,11 @@ class Trapezoid2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Trapezoid2D."""
-        self.arg_keys = ['r1', 'r2', 'height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r1': 'float', 'r2': 'float', 'height': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r1', 'r2', 'height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r1': 'float', 'r2': 'float', 'height': 'float'}
 
 @register_node_decorator
 class Triangle2D(GLNode):
@@ -1056,18 +740,11 @@ class Triangle2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Triangle2D."""
-        self.arg_keys = ['p0', 'p1', 'p2']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'p0': 'Vector[2]', 'p1': 'Vector[2]', 'p2': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['p0', 'p1', 'p2']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'p0': 'Vector[2]', 'p1': 'Vector[2]', 'p2': 'Vector[2]'}
 
 @register_node_decorator
 class Tunnel2D(GLNode):
@@ -1079,18 +756,11 @@ class Tunnel2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Tunnel2D."""
-        self.arg_keys = ['wh']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'wh': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['wh']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'wh': 'Vector[2]'}
 
 @register_node_decorator
 class UnevenCapsule2D(GLNode):
@@ -1102,18 +772,11 @@ class UnevenCapsule2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for UnevenCapsule2D."""
-        self.arg_keys = ['r1', 'r2', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r1': 'float', 'r2': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r1', 'r2', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r1': 'float', 'r2': 'float', 'h': 'float'}
 
 @register_node_decorator
 class Vesica2D(GLNode):
@@ -1125,18 +788,11 @@ class Vesica2D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Vesica2D."""
-        self.arg_keys = ['r', 'd']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float', 'd': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r', 'd']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float', 'd': 'float'}
 
 @register_node_decorator
 class ArbitraryCappedCone3D(GLNode):
@@ -1148,18 +804,11 @@ class ArbitraryCappedCone3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ArbitraryCappedCone3D."""
-        self.arg_keys = ['a', 'b', 'ra', 'rb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'ra': 'float', 'rb': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'ra', 'rb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'ra': 'float', 'rb': 'float'}
 
 @register_node_decorator
 class ArbitraryCappedCylinder3D(GLNode):
@@ -1171,18 +820,11 @@ class ArbitraryCappedCylinder3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ArbitraryCappedCylinder3D."""
-        self.arg_keys = ['a', 'b', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'r': 'float'}
 
 @register_node_decorator
 class ArbitraryRoundCone3D(GLNode):
@@ -1194,18 +836,11 @@ class ArbitraryRoundCone3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ArbitraryRoundCone3D."""
-        self.arg_keys = ['a', 'b', 'r1', 'r2']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'r1': 'float', 'r2': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'r1', 'r2']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'r1': 'float', 'r2': 'float'}
 
 @register_node_decorator
 class Box3D(GLNode):
@@ -1217,18 +852,11 @@ class Box3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Box3D."""
-        self.arg_keys = ['size']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'size': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['size']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'size': 'Vector[3]'}
 
 @register_node_decorator
 class BoxFrame3D(GLNode):
@@ -1240,18 +868,11 @@ class BoxFrame3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for BoxFrame3D."""
-        self.arg_keys = ['b', 'e']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'b': 'Vector[3]', 'e': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['b', 'e']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'b': 'Vector[3]', 'e': 'float'}
 
 @register_node_decorator
 class CappedCone3D(GLNode):
@@ -1263,18 +884,11 @@ class CappedCone3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CappedCone3D."""
-        self.arg_keys = ['r1', 'r2', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r1': 'float', 'r2': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r1', 'r2', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r1': 'float', 'r2': 'float', 'h': 'float'}
 
 @register_node_decorator
 class CappedCylinder3D(GLNode):
@@ -1286,18 +900,11 @@ class CappedCylinder3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CappedCylinder3D."""
-        self.arg_keys = ['h', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'float', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'float', 'r': 'float'}
 
 @register_node_decorator
 class CappedTorus3D(GLNode):
@@ -1309,18 +916,11 @@ class CappedTorus3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CappedTorus3D."""
-        self.arg_keys = ['angle', 'ra', 'rb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'angle': 'float', 'ra': 'float', 'rb': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['angle', 'ra', 'rb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'angle': 'float', 'ra': 'float', 'rb': 'float'}
 
 @register_node_decorator
 class Capsule3D(GLNode):
@@ -1332,18 +932,11 @@ class Capsule3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Capsule3D."""
-        self.arg_keys = ['a', 'b', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'r': 'float'}
 
 @register_node_decorator
 class Cone3D(GLNode):
@@ -1355,18 +948,11 @@ class Cone3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Cone3D."""
-        self.arg_keys = ['angle', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'angle': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['angle', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'angle': 'float', 'h': 'float'}
 
 @register_node_decorator
 class Cuboid3D(GLNode):
@@ -1378,18 +964,11 @@ class Cuboid3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Cuboid3D."""
-        self.arg_keys = ['size']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'size': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['size']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'size': 'Vector[3]'}
 
 @register_node_decorator
 class CutHollowSphere(GLNode):
@@ -1401,18 +980,11 @@ class CutHollowSphere(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CutHollowSphere."""
-        self.arg_keys = ['r', 'h', 't']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float', 'h': 'float', 't': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r', 'h', 't']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float', 'h': 'float', 't': 'float'}
 
 @register_node_decorator
 class CutSphere3D(GLNode):
@@ -1424,18 +996,11 @@ class CutSphere3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CutSphere3D."""
-        self.arg_keys = ['r', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'float', 'h': 'float'}
 
 @register_node_decorator
 class Cylinder3D(GLNode):
@@ -1447,18 +1012,11 @@ class Cylinder3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Cylinder3D."""
-        self.arg_keys = ['h', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'float', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'float', 'r': 'float'}
 
 @register_node_decorator
 class DeathStar3D(GLNode):
@@ -1470,18 +1028,11 @@ class DeathStar3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for DeathStar3D."""
-        self.arg_keys = ['ra', 'rb', 'd']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'ra': 'float', 'rb': 'float', 'd': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['ra', 'rb', 'd']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'ra': 'float', 'rb': 'float', 'd': 'float'}
 
 @register_node_decorator
 class HexPrism3D(GLNode):
@@ -1493,18 +1044,11 @@ class HexPrism3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for HexPrism3D."""
-        self.arg_keys = ['h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'Vector[2]'}
 
 @register_node_decorator
 class InexactAnisotropicGaussian3D(GLNode):
@@ -1516,18 +1060,11 @@ class InexactAnisotropicGaussian3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InexactAnisotropicGaussian3D."""
-        self.arg_keys = ['center', 'axial_radii', 'scale_constant']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'center': 'Vector[3]', 'axial_radii': 'Vector[3]', 'scale_constant': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['center', 'axial_radii', 'scale_constant']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'center': 'Vector[3]', 'axial_radii': 'Vector[3]', 'scale_constant': 'float'}
 
 @register_node_decorator
 class InexactCone3D(GLNode):
@@ -1539,18 +1076,11 @@ class InexactCone3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InexactCone3D."""
-        self.arg_keys = ['angle', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'angle': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['angle', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'angle': 'float', 'h': 'float'}
 
 @register_node_decorator
 class InexactEllipsoid3D(GLNode):
@@ -1562,18 +1092,11 @@ class InexactEllipsoid3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InexactEllipsoid3D."""
-        self.arg_keys = ['r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r': 'Vector[3]'}
 
 @register_node_decorator
 class InexactOctahedron3D(GLNode):
@@ -1585,18 +1108,11 @@ class InexactOctahedron3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InexactOctahedron3D."""
-        self.arg_keys = ['s']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'s': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['s']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'s': 'float'}
 
 @register_node_decorator
 class InexactSuperQuadrics3D(GLNode):
@@ -1608,18 +1124,11 @@ class InexactSuperQuadrics3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InexactSuperQuadrics3D."""
-        self.arg_keys = ['skew_vec', 'epsilon_1', 'epsilon_2']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'skew_vec': 'Vector[3]', 'epsilon_1': 'float', 'epsilon_2': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['skew_vec', 'epsilon_1', 'epsilon_2']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'skew_vec': 'Vector[3]', 'epsilon_1': 'float', 'epsilon_2': 'float'}
 
 @register_node_decorator
 class InfiniteCone3D(GLNode):
@@ -1631,18 +1140,11 @@ class InfiniteCone3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InfiniteCone3D."""
-        self.arg_keys = ['angle']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'angle': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['angle']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'angle': 'float'}
 
 @register_node_decorator
 class InfiniteCylinder3D(GLNode):
@@ -1654,18 +1156,11 @@ class InfiniteCylinder3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for InfiniteCylinder3D."""
-        self.arg_keys = ['c']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'c': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['c']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'c': 'Vector[3]'}
 
 @register_node_decorator
 class Link3D(GLNode):
@@ -1677,18 +1172,11 @@ class Link3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Link3D."""
-        self.arg_keys = ['le', 'r1', 'r2']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'le': 'float', 'r1': 'float', 'r2': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['le', 'r1', 'r2']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'le': 'float', 'r1': 'float', 'r2': 'float'}
 
 @register_node_decorator
 class NoParamCuboid3D(GLNode):
@@ -1700,18 +1188,11 @@ class NoParamCuboid3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NoParamCuboid3D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class NoParamCylinder3D(GLNode):
@@ -1723,18 +1204,11 @@ class NoParamCylinder3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NoParamCylinder3D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class NoParamSphere3D(GLNode):
@@ -1746,18 +1220,11 @@ class NoParamSphere3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NoParamSphere3D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class NullExpression3D(GLNode):
@@ -1769,18 +1236,11 @@ class NullExpression3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NullExpression3D."""
-        self.arg_keys = []
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = []
+    default_values = {}
+    is_variadic = False
+    arg_types = {}
 
 @register_node_decorator
 class Octahedron3D(GLNode):
@@ -1792,18 +1252,11 @@ class Octahedron3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Octahedron3D."""
-        self.arg_keys = ['s']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'s': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['s']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'s': 'float'}
 
 @register_node_decorator
 class Plane3D(GLNode):
@@ -1815,18 +1268,11 @@ class Plane3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Plane3D."""
-        self.arg_keys = ['n', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'n': 'Vector[3]', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['n', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'n': 'Vector[3]', 'h': 'float'}
 
 @register_node_decorator
 class PlaneV23D(GLNode):
@@ -1838,18 +1284,11 @@ class PlaneV23D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for PlaneV23D."""
-        self.arg_keys = ['origin', 'normal']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'origin': 'Vector[3]', 'normal': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['origin', 'normal']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'origin': 'Vector[3]', 'normal': 'Vector[3]'}
 
 @register_node_decorator
 class Pyramid3D(GLNode):
@@ -1861,18 +1300,11 @@ class Pyramid3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Pyramid3D."""
-        self.arg_keys = ['h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'float'}
 
 @register_node_decorator
 class Quadrilateral3D(GLNode):
@@ -1884,18 +1316,11 @@ class Quadrilateral3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Quadrilateral3D."""
-        self.arg_keys = ['a', 'b', 'c', 'd']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'c': 'Vector[3]', 'd': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'c', 'd']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'c': 'Vector[3]', 'd': 'Vector[3]'}
 
 @register_node_decorator
 class RevolvedVesica3D(GLNode):
@@ -1907,18 +1332,11 @@ class RevolvedVesica3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RevolvedVesica3D."""
-        self.arg_keys = ['a', 'b', 'w']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'w': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'w']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'w': 'float'}
 
 @register_node_decorator
 class Rhombus3D(GLNode):
@@ -1930,18 +1348,11 @@ class Rhombus3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Rhombus3D."""
-        self.arg_keys = ['la', 'lb', 'h', 'ra']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'la': 'float', 'lb': 'float', 'h': 'float', 'ra': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['la', 'lb', 'h', 'ra']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'la': 'float', 'lb': 'float', 'h': 'float', 'ra': 'float'}
 
 @register_node_decorator
 class RoundCone3D(GLNode):
@@ -1953,18 +1364,11 @@ class RoundCone3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RoundCone3D."""
-        self.arg_keys = ['r1', 'r2', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'r1': 'float', 'r2': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['r1', 'r2', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'r1': 'float', 'r2': 'float', 'h': 'float'}
 
 @register_node_decorator
 class RoundedBox3D(GLNode):
@@ -1976,18 +1380,11 @@ class RoundedBox3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RoundedBox3D."""
-        self.arg_keys = ['size', 'radius']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'size': 'Vector[3]', 'radius': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['size', 'radius']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'size': 'Vector[3]', 'radius': 'float'}
 
 @register_node_decorator
 class RoundedCylinder3D(GLNode):
@@ -1999,18 +1396,11 @@ class RoundedCylinder3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RoundedCylinder3D."""
-        self.arg_keys = ['ra', 'rb', 'h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'ra': 'float', 'rb': 'float', 'h': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['ra', 'rb', 'h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'ra': 'float', 'rb': 'float', 'h': 'float'}
 
 @register_node_decorator
 class SDFGrid3D(GLNode):
@@ -2022,18 +1412,11 @@ class SDFGrid3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SDFGrid3D."""
-        self.arg_keys = ['sdf_grid', 'name', 'bound_threshold']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'sdf_grid': 'Tensor[float, (D,H,W)]', 'name': 'string', 'bound_threshold': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['sdf_grid', 'name', 'bound_threshold']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'sdf_grid': 'Tensor[float, (D,H,W)]', 'name': 'string', 'bound_threshold': 'float'}
 
 @register_node_decorator
 class SolidAngle3D(GLNode):
@@ -2045,18 +1428,11 @@ class SolidAngle3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SolidAngle3D."""
-        self.arg_keys = ['angle', 'ra']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'angle': 'float', 'ra': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['angle', 'ra']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'angle': 'float', 'ra': 'float'}
 
 @register_node_decorator
 class Sphere3D(GLNode):
@@ -2068,18 +1444,11 @@ class Sphere3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Sphere3D."""
-        self.arg_keys = ['radius']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'radius': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['radius']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'radius': 'float'}
 
 @register_node_decorator
 class Torus3D(GLNode):
@@ -2091,18 +1460,11 @@ class Torus3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Torus3D."""
-        self.arg_keys = ['t']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'t': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['t']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'t': 'Vector[2]'}
 
 @register_node_decorator
 class TriPrism3D(GLNode):
@@ -2114,18 +1476,11 @@ class TriPrism3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TriPrism3D."""
-        self.arg_keys = ['h']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'Vector[2]'}
 
 @register_node_decorator
 class Triangle3D(GLNode):
@@ -2137,18 +1492,11 @@ class Triangle3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Triangle3D."""
-        self.arg_keys = ['a', 'b', 'c']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'c': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['a', 'b', 'c']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'a': 'Vector[3]', 'b': 'Vector[3]', 'c': 'Vector[3]'}
 
 @register_node_decorator
 class VerticalCappedCylinder3D(GLNode):
@@ -2160,18 +1508,11 @@ class VerticalCappedCylinder3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for VerticalCappedCylinder3D."""
-        self.arg_keys = ['h', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'float', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'float', 'r': 'float'}
 
 @register_node_decorator
 class VerticalCapsule3D(GLNode):
@@ -2183,18 +1524,11 @@ class VerticalCapsule3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for VerticalCapsule3D."""
-        self.arg_keys = ['h', 'r']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'h': 'float', 'r': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['h', 'r']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'h': 'float', 'r': 'float'}
 
 @register_node_decorator
 class CubicBezierExtrude3D(GLNode):
@@ -2206,18 +1540,11 @@ class CubicBezierExtrude3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for CubicBezierExtrude3D."""
-        self.arg_keys = ['input', 'controls', 'height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'input': 'Expr', 'controls': 'Tuple[Vector[2],Vector[2],Vector[2]]', 'height': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['input', 'controls', 'height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'input': 'Expr', 'controls': 'Tuple[Vector[2],Vector[2],Vector[2]]', 'height': 'float'}
 
 @register_node_decorator
 class LinearCurve1D(GLNode):
@@ -2229,18 +1556,11 @@ class LinearCurve1D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for LinearCurve1D."""
-        self.arg_keys = ['points']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'points': 'List[Vector[2]]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['points']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'points': 'List[Vector[2]]'}
 
 @register_node_decorator
 class LinearExtrude3D(GLNode):
@@ -2252,18 +1572,11 @@ class LinearExtrude3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for LinearExtrude3D."""
-        self.arg_keys = ['input', 'height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'input': 'Expr', 'height': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['input', 'height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'input': 'Expr', 'height': 'float'}
 
 @register_node_decorator
 class PolyQuadBezierExtrude3D(GLNode):
@@ -2275,18 +1588,11 @@ class PolyQuadBezierExtrude3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for PolyQuadBezierExtrude3D."""
-        self.arg_keys = ['input', 'controls', 'height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'input': 'Expr', 'controls': 'List[Vector[2]]', 'height': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['input', 'controls', 'height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'input': 'Expr', 'controls': 'List[Vector[2]]', 'height': 'float'}
 
 @register_node_decorator
 class PolyStraightLineCurve1D(GLNode):
@@ -2298,18 +1604,11 @@ class PolyStraightLineCurve1D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for PolyStraightLineCurve1D."""
-        self.arg_keys = ['points']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'points': 'List[Vector[2]]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['points']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'points': 'List[Vector[2]]'}
 
 @register_node_decorator
 class QuadraticBezierExtrude3D(GLNode):
@@ -2321,18 +1620,11 @@ class QuadraticBezierExtrude3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for QuadraticBezierExtrude3D."""
-        self.arg_keys = ['input', 'control', 'height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'input': 'Expr', 'control': 'Vector[2]', 'height': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['input', 'control', 'height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'input': 'Expr', 'control': 'Vector[2]', 'height': 'float'}
 
 @register_node_decorator
 class QuadraticCurve1D(GLNode):
@@ -2344,18 +1636,11 @@ class QuadraticCurve1D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for QuadraticCurve1D."""
-        self.arg_keys = ['points']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'points': 'Tuple[Vector[2],Vector[2],Vector[2]]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['points']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'points': 'Tuple[Vector[2],Vector[2],Vector[2]]'}
 
 @register_node_decorator
 class SimpleExtrusion3D(GLNode):
@@ -2367,18 +1652,11 @@ class SimpleExtrusion3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SimpleExtrusion3D."""
-        self.arg_keys = ['input', 'height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'input': 'Expr', 'height': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['input', 'height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'input': 'Expr', 'height': 'float'}
 
 @register_node_decorator
 class SimpleRevolution3D(GLNode):
@@ -2390,18 +1668,11 @@ class SimpleRevolution3D(GLNode):
     # Embed category metadata in the class
     node_category = "primitives_higher"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SimpleRevolution3D."""
-        self.arg_keys = ['input', 'radius']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'input': 'Expr', 'radius': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['input', 'radius']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'input': 'Expr', 'radius': 'float'}
 
 @register_node_decorator
 class Affine2D(GLNode):
@@ -2413,18 +1684,11 @@ class Affine2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Affine2D."""
-        self.arg_keys = ['expr', 'matrix']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'matrix': 'Matrix[3,3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'matrix']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'matrix': 'Matrix[3,3]'}
 
 @register_node_decorator
 class AxialReflect2D(GLNode):
@@ -2436,18 +1700,11 @@ class AxialReflect2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AxialReflect2D."""
-        self.arg_keys = ['expr', 'axis']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'axis': 'Enum["AX2D"|"AY2D"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'axis']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'axis': 'Enum["AX2D"|"AY2D"]'}
 
 @register_node_decorator
 class AxialScaleSymmetry2D(GLNode):
@@ -2459,18 +1716,11 @@ class AxialScaleSymmetry2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AxialScaleSymmetry2D."""
-        self.arg_keys = ['expr', 'distance', 'count', 'axis']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int', 'axis': 'Enum["AX2D"|"AY2D"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count', 'axis']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int', 'axis': 'Enum["AX2D"|"AY2D"]'}
 
 @register_node_decorator
 class AxialTranslationSymmetry2D(GLNode):
@@ -2482,18 +1732,11 @@ class AxialTranslationSymmetry2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AxialTranslationSymmetry2D."""
-        self.arg_keys = ['expr', 'distance', 'count', 'axis']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int', 'axis': 'Enum["AX2D"|"AY2D"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count', 'axis']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int', 'axis': 'Enum["AX2D"|"AY2D"]'}
 
 @register_node_decorator
 class Dilate2D(GLNode):
@@ -2505,18 +1748,11 @@ class Dilate2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Dilate2D."""
-        self.arg_keys = ['expr', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class Distort2D(GLNode):
@@ -2528,18 +1764,11 @@ class Distort2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Distort2D."""
-        self.arg_keys = ['expr', 'amount']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'amount': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'amount']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'amount': 'float'}
 
 @register_node_decorator
 class Erode2D(GLNode):
@@ -2551,18 +1780,11 @@ class Erode2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Erode2D."""
-        self.arg_keys = ['expr', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class EulerRotate2D(GLNode):
@@ -2574,18 +1796,11 @@ class EulerRotate2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for EulerRotate2D."""
-        self.arg_keys = ['expr', 'angle']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angle': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angle']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angle': 'float'}
 
 @register_node_decorator
 class Onion2D(GLNode):
@@ -2597,18 +1812,11 @@ class Onion2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Onion2D."""
-        self.arg_keys = ['expr', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class Reflect2D(GLNode):
@@ -2620,18 +1828,11 @@ class Reflect2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Reflect2D."""
-        self.arg_keys = ['expr', 'normal']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'normal': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'normal']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'normal': 'Vector[2]'}
 
 @register_node_decorator
 class ReflectCoords2D(GLNode):
@@ -2643,18 +1844,11 @@ class ReflectCoords2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ReflectCoords2D."""
-        self.arg_keys = ['expr', 'normal']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'normal': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'normal']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'normal': 'Vector[2]'}
 
 @register_node_decorator
 class ReflectX2D(GLNode):
@@ -2666,18 +1860,11 @@ class ReflectX2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ReflectX2D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class ReflectY2D(GLNode):
@@ -2689,18 +1876,11 @@ class ReflectY2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ReflectY2D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class RotationSymmetry2D(GLNode):
@@ -2712,18 +1892,11 @@ class RotationSymmetry2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RotationSymmetry2D."""
-        self.arg_keys = ['expr', 'angle', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angle', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
 
 @register_node_decorator
 class Scale2D(GLNode):
@@ -2735,18 +1908,11 @@ class Scale2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Scale2D."""
-        self.arg_keys = ['expr', 'scale']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'scale': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'scale']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'scale': 'Vector[2]'}
 
 @register_node_decorator
 class ScaleSymmetry2D(GLNode):
@@ -2758,18 +1924,11 @@ class ScaleSymmetry2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ScaleSymmetry2D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class Shear2D(GLNode):
@@ -2781,18 +1940,11 @@ class Shear2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Shear2D."""
-        self.arg_keys = ['expr', 'shear']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'shear': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'shear']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'shear': 'Vector[2]'}
 
 @register_node_decorator
 class Translate2D(GLNode):
@@ -2804,18 +1956,11 @@ class Translate2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Translate2D."""
-        self.arg_keys = ['expr', 'offset']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'offset': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'offset']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'offset': 'Vector[2]'}
 
 @register_node_decorator
 class TranslationSymmetry2D(GLNode):
@@ -2827,18 +1972,11 @@ class TranslationSymmetry2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TranslationSymmetry2D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class TranslationSymmetryX2D(GLNode):
@@ -2850,18 +1988,11 @@ class TranslationSymmetryX2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TranslationSymmetryX2D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class TranslationSymmetryY2D(GLNode):
@@ -2873,18 +2004,11 @@ class TranslationSymmetryY2D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_2d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TranslationSymmetryY2D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class Affine3D(GLNode):
@@ -2896,18 +2020,11 @@ class Affine3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Affine3D."""
-        self.arg_keys = ['expr', 'matrix']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'matrix': 'Matrix[4,4]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'matrix']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'matrix': 'Matrix[4,4]'}
 
 @register_node_decorator
 class AxialReflect3D(GLNode):
@@ -2919,18 +2036,11 @@ class AxialReflect3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AxialReflect3D."""
-        self.arg_keys = ['expr', 'axis']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'axis': 'Enum["AX3D"|"AY3D"|"AZ3D"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'axis']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'axis': 'Enum["AX3D"|"AY3D"|"AZ3D"]'}
 
 @register_node_decorator
 class AxialRotationSymmetry3D(GLNode):
@@ -2942,18 +2052,11 @@ class AxialRotationSymmetry3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AxialRotationSymmetry3D."""
-        self.arg_keys = ['expr', 'angle', 'count', 'axis']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int', 'axis': 'Enum["AX3D"|"AY3D"|"AZ3D"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angle', 'count', 'axis']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int', 'axis': 'Enum["AX3D"|"AY3D"|"AZ3D"]'}
 
 @register_node_decorator
 class AxialTranslationSymmetry3D(GLNode):
@@ -2965,18 +2068,11 @@ class AxialTranslationSymmetry3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AxialTranslationSymmetry3D."""
-        self.arg_keys = ['expr', 'distance', 'count', 'axis']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int', 'axis': 'Enum["AX3D"|"AY3D"|"AZ3D"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count', 'axis']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int', 'axis': 'Enum["AX3D"|"AY3D"|"AZ3D"]'}
 
 @register_node_decorator
 class AxisAngleRotate3D(GLNode):
@@ -2988,18 +2084,11 @@ class AxisAngleRotate3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AxisAngleRotate3D."""
-        self.arg_keys = ['expr', 'axis', 'angle']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'axis': 'Vector[3]', 'angle': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'axis', 'angle']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'axis': 'Vector[3]', 'angle': 'float'}
 
 @register_node_decorator
 class Bend3D(GLNode):
@@ -3011,18 +2100,11 @@ class Bend3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Bend3D."""
-        self.arg_keys = ['expr', 'amount']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'amount': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'amount']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'amount': 'float'}
 
 @register_node_decorator
 class Dilate3D(GLNode):
@@ -3034,18 +2116,11 @@ class Dilate3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Dilate3D."""
-        self.arg_keys = ['expr', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class Distort3D(GLNode):
@@ -3057,18 +2132,11 @@ class Distort3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Distort3D."""
-        self.arg_keys = ['expr', 'amount']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'amount': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'amount']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'amount': 'float'}
 
 @register_node_decorator
 class Erode3D(GLNode):
@@ -3080,18 +2148,11 @@ class Erode3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Erode3D."""
-        self.arg_keys = ['expr', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class EulerRotate3D(GLNode):
@@ -3103,18 +2164,11 @@ class EulerRotate3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for EulerRotate3D."""
-        self.arg_keys = ['expr', 'angles']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angles': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angles']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angles': 'Vector[3]'}
 
 @register_node_decorator
 class NegOnlyOnion3D(GLNode):
@@ -3126,18 +2180,11 @@ class NegOnlyOnion3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NegOnlyOnion3D."""
-        self.arg_keys = ['expr', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class Onion3D(GLNode):
@@ -3149,18 +2196,11 @@ class Onion3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Onion3D."""
-        self.arg_keys = ['expr', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class QuaternionRotate3D(GLNode):
@@ -3172,18 +2212,11 @@ class QuaternionRotate3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for QuaternionRotate3D."""
-        self.arg_keys = ['expr', 'quat']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'quat': 'Vector[4]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'quat']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'quat': 'Vector[4]'}
 
 @register_node_decorator
 class Reflect3D(GLNode):
@@ -3195,18 +2228,11 @@ class Reflect3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Reflect3D."""
-        self.arg_keys = ['expr', 'normal']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'normal': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'normal']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'normal': 'Vector[3]'}
 
 @register_node_decorator
 class ReflectCoords3D(GLNode):
@@ -3218,18 +2244,11 @@ class ReflectCoords3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ReflectCoords3D."""
-        self.arg_keys = ['expr', 'normal']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'normal': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'normal']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'normal': 'Vector[3]'}
 
 @register_node_decorator
 class ReflectX3D(GLNode):
@@ -3241,18 +2260,11 @@ class ReflectX3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ReflectX3D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class ReflectY3D(GLNode):
@@ -3264,18 +2276,11 @@ class ReflectY3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ReflectY3D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class ReflectZ3D(GLNode):
@@ -3287,18 +2292,11 @@ class ReflectZ3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ReflectZ3D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class RotateMatrix3D(GLNode):
@@ -3310,18 +2308,11 @@ class RotateMatrix3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RotateMatrix3D."""
-        self.arg_keys = ['expr', 'matrix']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'matrix': 'Matrix[3,3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'matrix']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'matrix': 'Matrix[3,3]'}
 
 @register_node_decorator
 class RotationSymmetry3D(GLNode):
@@ -3333,18 +2324,11 @@ class RotationSymmetry3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RotationSymmetry3D."""
-        self.arg_keys = ['expr', 'angle', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angle', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
 
 @register_node_decorator
 class RotationSymmetryX3D(GLNode):
@@ -3356,18 +2340,11 @@ class RotationSymmetryX3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RotationSymmetryX3D."""
-        self.arg_keys = ['expr', 'angle', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angle', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
 
 @register_node_decorator
 class RotationSymmetryY3D(GLNode):
@@ -3379,18 +2356,11 @@ class RotationSymmetryY3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RotationSymmetryY3D."""
-        self.arg_keys = ['expr', 'angle', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angle', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
 
 @register_node_decorator
 class RotationSymmetryZ3D(GLNode):
@@ -3402,18 +2372,11 @@ class RotationSymmetryZ3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RotationSymmetryZ3D."""
-        self.arg_keys = ['expr', 'angle', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'angle', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'angle': 'float', 'count': 'int'}
 
 @register_node_decorator
 class Scale3D(GLNode):
@@ -3425,18 +2388,11 @@ class Scale3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Scale3D."""
-        self.arg_keys = ['expr', 'scale']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'scale': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'scale']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'scale': 'Vector[3]'}
 
 @register_node_decorator
 class Shear3D(GLNode):
@@ -3448,18 +2404,11 @@ class Shear3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Shear3D."""
-        self.arg_keys = ['expr', 'shear']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'shear': 'Vector[6]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'shear']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'shear': 'Vector[6]'}
 
 @register_node_decorator
 class Translate3D(GLNode):
@@ -3471,18 +2420,11 @@ class Translate3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Translate3D."""
-        self.arg_keys = ['expr', 'offset']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'offset': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'offset']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'offset': 'Vector[3]'}
 
 @register_node_decorator
 class TranslationSymmetry3D(GLNode):
@@ -3494,18 +2436,11 @@ class TranslationSymmetry3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TranslationSymmetry3D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class TranslationSymmetryX3D(GLNode):
@@ -3517,18 +2452,11 @@ class TranslationSymmetryX3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TranslationSymmetryX3D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class TranslationSymmetryY3D(GLNode):
@@ -3540,18 +2468,11 @@ class TranslationSymmetryY3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TranslationSymmetryY3D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class TranslationSymmetryZ3D(GLNode):
@@ -3563,18 +2484,11 @@ class TranslationSymmetryZ3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for TranslationSymmetryZ3D."""
-        self.arg_keys = ['expr', 'distance', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'distance', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'distance': 'float', 'count': 'int'}
 
 @register_node_decorator
 class Twist3D(GLNode):
@@ -3586,18 +2500,11 @@ class Twist3D(GLNode):
     # Embed category metadata in the class
     node_category = "transforms_3d"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Twist3D."""
-        self.arg_keys = ['expr', 'amount']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'amount': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'amount']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'amount': 'float'}
 
 @register_node_decorator
 class Complement(GLNode):
@@ -3609,18 +2516,11 @@ class Complement(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Complement."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class Difference(GLNode):
@@ -3632,18 +2532,11 @@ class Difference(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Difference."""
-        self.arg_keys = ['expr_0', 'expr_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
 
 @register_node_decorator
 class Intersection(GLNode):
@@ -3655,18 +2548,11 @@ class Intersection(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Intersection."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = True
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = True
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class JoinUnion(GLNode):
@@ -3678,18 +2564,11 @@ class JoinUnion(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for JoinUnion."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = True
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = True
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class NarySmoothIntersection(GLNode):
@@ -3701,18 +2580,11 @@ class NarySmoothIntersection(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NarySmoothIntersection."""
-        self.arg_keys = ['expr_0', 'expr_1', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class NarySmoothUnion(GLNode):
@@ -3724,18 +2596,11 @@ class NarySmoothUnion(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NarySmoothUnion."""
-        self.arg_keys = ['expr_0', 'expr_1', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class SmoothDifference(GLNode):
@@ -3747,18 +2612,11 @@ class SmoothDifference(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SmoothDifference."""
-        self.arg_keys = ['expr_0', 'expr_1', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class SmoothIntersection(GLNode):
@@ -3770,18 +2628,11 @@ class SmoothIntersection(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SmoothIntersection."""
-        self.arg_keys = ['expr_0', 'expr_1', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class SmoothUnion(GLNode):
@@ -3793,18 +2644,11 @@ class SmoothUnion(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SmoothUnion."""
-        self.arg_keys = ['expr_0', 'expr_1', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class SwitchedDifference(GLNode):
@@ -3816,18 +2660,11 @@ class SwitchedDifference(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SwitchedDifference."""
-        self.arg_keys = ['expr_0', 'expr_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
 
 @register_node_decorator
 class Union(GLNode):
@@ -3839,18 +2676,11 @@ class Union(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Union."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = True
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = True
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class XOR(GLNode):
@@ -3862,18 +2692,11 @@ class XOR(GLNode):
     # Embed category metadata in the class
     node_category = "combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for XOR."""
-        self.arg_keys = ['expr_0', 'expr_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
 
 @register_node_decorator
 class AlphaMask2D(GLNode):
@@ -3885,18 +2708,11 @@ class AlphaMask2D(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AlphaMask2D."""
-        self.arg_keys = ['canvas']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas': 'Expr'}
 
 @register_node_decorator
 class AlphaToSDF2D(GLNode):
@@ -3908,18 +2724,11 @@ class AlphaToSDF2D(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for AlphaToSDF2D."""
-        self.arg_keys = ['expr', 'dx', 'canvas_shape']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'dx': 'float', 'canvas_shape': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'dx', 'canvas_shape']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'dx': 'float', 'canvas_shape': 'Vector[2]'}
 
 @register_node_decorator
 class ApplyColor2D(GLNode):
@@ -3931,18 +2740,11 @@ class ApplyColor2D(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ApplyColor2D."""
-        self.arg_keys = ['expr', 'color']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'color': 'Union[Vector[4]|str]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'color']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'color': 'Union[Vector[4]|str]'}
 
 @register_node_decorator
 class DestinationAtop(GLNode):
@@ -3954,18 +2756,11 @@ class DestinationAtop(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for DestinationAtop."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class DestinationIn(GLNode):
@@ -3977,18 +2772,11 @@ class DestinationIn(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for DestinationIn."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class DestinationOut(GLNode):
@@ -4000,18 +2788,11 @@ class DestinationOut(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for DestinationOut."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class DestinationOver(GLNode):
@@ -4023,18 +2804,11 @@ class DestinationOver(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for DestinationOver."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class HSL2RGB(GLNode):
@@ -4046,18 +2820,11 @@ class HSL2RGB(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for HSL2RGB."""
-        self.arg_keys = ['hsl']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'hsl': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['hsl']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'hsl': 'Vector[3]'}
 
 @register_node_decorator
 class HSV2RGB(GLNode):
@@ -4069,18 +2836,11 @@ class HSV2RGB(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for HSV2RGB."""
-        self.arg_keys = ['hsv']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'hsv': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['hsv']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'hsv': 'Vector[3]'}
 
 @register_node_decorator
 class HueShift(GLNode):
@@ -4092,18 +2852,11 @@ class HueShift(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for HueShift."""
-        self.arg_keys = ['rgb', 'amount']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'rgb': 'Vector[3]', 'amount': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['rgb', 'amount']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'rgb': 'Vector[3]', 'amount': 'float'}
 
 @register_node_decorator
 class ModifyColor2D(GLNode):
@@ -4115,18 +2868,11 @@ class ModifyColor2D(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ModifyColor2D."""
-        self.arg_keys = ['canvas', 'color']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas': 'Expr', 'color': 'Union[Vector[4]|str]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas', 'color']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas': 'Expr', 'color': 'Union[Vector[4]|str]'}
 
 @register_node_decorator
 class ModifyColorTritone2D(GLNode):
@@ -4138,18 +2884,11 @@ class ModifyColorTritone2D(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ModifyColorTritone2D."""
-        self.arg_keys = ['canvas', 'color_a', 'color_b', 'color_c']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas': 'Expr', 'color_a': 'Union[Vector[4]|str]', 'color_b': 'Union[Vector[4]|str]', 'color_c': 'Union[Vector[4]|str]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas', 'color_a', 'color_b', 'color_c']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas': 'Expr', 'color_a': 'Union[Vector[4]|str]', 'color_b': 'Union[Vector[4]|str]', 'color_c': 'Union[Vector[4]|str]'}
 
 @register_node_decorator
 class ModifyOpacity2D(GLNode):
@@ -4161,18 +2900,11 @@ class ModifyOpacity2D(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ModifyOpacity2D."""
-        self.arg_keys = ['canvas', 'alpha']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas': 'Expr', 'alpha': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas', 'alpha']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas': 'Expr', 'alpha': 'float'}
 
 @register_node_decorator
 class RGB2HSL(GLNode):
@@ -4184,18 +2916,11 @@ class RGB2HSL(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RGB2HSL."""
-        self.arg_keys = ['rgb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'rgb': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['rgb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'rgb': 'Vector[3]'}
 
 @register_node_decorator
 class RGB2HSV(GLNode):
@@ -4207,18 +2932,11 @@ class RGB2HSV(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RGB2HSV."""
-        self.arg_keys = ['rgb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'rgb': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['rgb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'rgb': 'Vector[3]'}
 
 @register_node_decorator
 class SVGXOR(GLNode):
@@ -4230,18 +2948,11 @@ class SVGXOR(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SVGXOR."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class SourceAtop(GLNode):
@@ -4253,18 +2964,11 @@ class SourceAtop(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SourceAtop."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class SourceIn(GLNode):
@@ -4276,18 +2980,11 @@ class SourceIn(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SourceIn."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class SourceOut(GLNode):
@@ -4299,18 +2996,11 @@ class SourceOut(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SourceOut."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class SourceOver(GLNode):
@@ -4322,18 +3012,11 @@ class SourceOver(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SourceOver."""
-        self.arg_keys = ['canvas_0', 'canvas_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas_0', 'canvas_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'canvas_0': 'Expr', 'canvas_1': 'Expr'}
 
 @register_node_decorator
 class SourceOverSequence(GLNode):
@@ -4345,18 +3028,11 @@ class SourceOverSequence(GLNode):
     # Embed category metadata in the class
     node_category = "color"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SourceOverSequence."""
-        self.arg_keys = ['canvas']
-        self.default_values = {}
-        self.is_variadic = True
-        self.arg_types = {'canvas': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['canvas']
+    default_values = {}
+    is_variadic = True
+    arg_types = {'canvas': 'Expr'}
 
 @register_node_decorator
 class BinaryOperator(GLNode):
@@ -4368,18 +3044,11 @@ class BinaryOperator(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for BinaryOperator."""
-        self.arg_keys = ['expr_0', 'expr_1', 'op']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'op': 'Enum["add"|"sub"|"mul"|"div"|"pow"|"atan2"|"min"|"max"|"step"|"mod"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'op']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'op': 'Enum["add"|"sub"|"mul"|"div"|"pow"|"atan2"|"min"|"max"|"step"|"mod"]'}
 
 @register_node_decorator
 class Float(GLNode):
@@ -4391,18 +3060,11 @@ class Float(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Float."""
-        self.arg_keys = ['value']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'value': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['value']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'value': 'float'}
 
 @register_node_decorator
 class UnaryOperator(GLNode):
@@ -4414,18 +3076,11 @@ class UnaryOperator(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for UnaryOperator."""
-        self.arg_keys = ['expr', 'op']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'op': 'Enum["sin"|"cos"|"tan"|"log"|"exp"|"sqrt"|"abs"|"floor"|"ceil"|"round"|"frac"|"sign"|"normalize"|"norm"|"neg"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'op']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'op': 'Enum["sin"|"cos"|"tan"|"log"|"exp"|"sqrt"|"abs"|"floor"|"ceil"|"round"|"frac"|"sign"|"normalize"|"norm"|"neg"]'}
 
 @register_node_decorator
 class UniformFloat(GLNode):
@@ -4437,18 +3092,11 @@ class UniformFloat(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for UniformFloat."""
-        self.arg_keys = ['min', 'default', 'max', 'name']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'min': 'float', 'default': 'float', 'max': 'float', 'name': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['min', 'default', 'max', 'name']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'min': 'float', 'default': 'float', 'max': 'float', 'name': 'str'}
 
 @register_node_decorator
 class UniformVec2(GLNode):
@@ -4460,18 +3108,11 @@ class UniformVec2(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for UniformVec2."""
-        self.arg_keys = ['min', 'default', 'max', 'name']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'min': 'Vector[2]', 'default': 'Vector[2]', 'max': 'Vector[2]', 'name': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['min', 'default', 'max', 'name']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'min': 'Vector[2]', 'default': 'Vector[2]', 'max': 'Vector[2]', 'name': 'str'}
 
 @register_node_decorator
 class UniformVec3(GLNode):
@@ -4483,18 +3124,11 @@ class UniformVec3(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for UniformVec3."""
-        self.arg_keys = ['min', 'default', 'max', 'name']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'min': 'Vector[3]', 'default': 'Vector[3]', 'max': 'Vector[3]', 'name': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['min', 'default', 'max', 'name']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'min': 'Vector[3]', 'default': 'Vector[3]', 'max': 'Vector[3]', 'name': 'str'}
 
 @register_node_decorator
 class UniformVec4(GLNode):
@@ -4506,18 +3140,11 @@ class UniformVec4(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for UniformVec4."""
-        self.arg_keys = ['min', 'default', 'max', 'name']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'min': 'Vector[4]', 'default': 'Vector[4]', 'max': 'Vector[4]', 'name': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['min', 'default', 'max', 'name']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'min': 'Vector[4]', 'default': 'Vector[4]', 'max': 'Vector[4]', 'name': 'str'}
 
 @register_node_decorator
 class Vec2(GLNode):
@@ -4529,18 +3156,11 @@ class Vec2(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Vec2."""
-        self.arg_keys = ['x', 'y']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'x': 'float', 'y': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['x', 'y']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'x': 'float', 'y': 'float'}
 
 @register_node_decorator
 class Vec3(GLNode):
@@ -4552,18 +3172,11 @@ class Vec3(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Vec3."""
-        self.arg_keys = ['x', 'y', 'z']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'x': 'float', 'y': 'float', 'z': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['x', 'y', 'z']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'x': 'float', 'y': 'float', 'z': 'float'}
 
 @register_node_decorator
 class Vec4(GLNode):
@@ -4575,18 +3188,11 @@ class Vec4(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Vec4."""
-        self.arg_keys = ['x', 'y', 'z', 'w']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'x': 'float', 'y': 'float', 'z': 'float', 'w': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['x', 'y', 'z', 'w']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'x': 'float', 'y': 'float', 'z': 'float', 'w': 'float'}
 
 @register_node_decorator
 class VecList(GLNode):
@@ -4598,18 +3204,11 @@ class VecList(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for VecList."""
-        self.arg_keys = ['vectors', 'count']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'vectors': 'List[Vector[3]]', 'count': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['vectors', 'count']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'vectors': 'List[Vector[3]]', 'count': 'int'}
 
 @register_node_decorator
 class VectorOperator(GLNode):
@@ -4621,18 +3220,11 @@ class VectorOperator(GLNode):
     # Embed category metadata in the class
     node_category = "variables"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for VectorOperator."""
-        self.arg_keys = ['expr', 'op']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'op': 'Enum["normalize"]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'op']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'op': 'Enum["normalize"]'}
 
 def register_all_nodes() -> List[str]:
     """Return list of all auto-registered GeoLIPI nodes."""
@@ -7,7 +7,6 @@ Do not edit this file manually - regenerate it instead.
 
 from typing import List
 from ..expr_node import GLNode
-from ..base import InputSocket
 from ..simple_registry import register_node_decorator
 
 
@@ -21,18 +20,11 @@ class ApplyHeight(GLNode):
     # Embed category metadata in the class
     node_category = "mxg"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for ApplyHeight."""
-        self.arg_keys = ['expr', 'height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'height': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'height': 'float'}
 
 @register_node_decorator
 class LinkedHeightField3D(GLNode):
@@ -44,18 +36,11 @@ class LinkedHeightField3D(GLNode):
     # Embed category metadata in the class
     node_category = "mxg"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for LinkedHeightField3D."""
-        self.arg_keys = ['plane', 'apply_height']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'plane': 'Expr', 'apply_height': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['plane', 'apply_height']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'plane': 'Expr', 'apply_height': 'Expr'}
 
 @register_node_decorator
 class MarkerNode(GLNode):
@@ -67,18 +52,11 @@ class MarkerNode(GLNode):
     # Embed category metadata in the class
     node_category = "mxg"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MarkerNode."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr'}
 
 @register_node_decorator
 class NamedGeometry(GLNode):
@@ -90,18 +68,11 @@ class NamedGeometry(GLNode):
     # Embed category metadata in the class
     node_category = "mxg"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NamedGeometry."""
-        self.arg_keys = ['name']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'name': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['name']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'name': 'str'}
 
 @register_node_decorator
 class SetMaterial(GLNode):
@@ -113,18 +84,11 @@ class SetMaterial(GLNode):
     # Embed category metadata in the class
     node_category = "mxg"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SetMaterial."""
-        self.arg_keys = ['expr', 'material']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'material': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'material']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'material': 'float'}
 
 def register_all_nodes() -> List[str]:
     """Return list of all auto-registered Migumi nodes."""
@@ -7,7 +7,6 @@ Do not edit this file manually - regenerate it instead.
 
 from typing import List
 from ..expr_node import GLNode
-from ..base import InputSocket
 from ..simple_registry import register_node_decorator
 
 
@@ -21,18 +20,11 @@ class BoundedSolid(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_base"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for BoundedSolid."""
-        self.arg_keys = ['expr', 'bounding', 'bound_threshold']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'bounding': 'Expr', 'bound_threshold': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr', 'bounding', 'bound_threshold']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'bounding': 'Expr', 'bound_threshold': 'float'}
 
 @register_node_decorator
 class GeomOnlySmoothUnion(GLNode):
@@ -44,18 +36,11 @@ class GeomOnlySmoothUnion(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_base"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for GeomOnlySmoothUnion."""
-        self.arg_keys = ['expr_0', 'expr_1', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class MatSolidV1(GLNode):
@@ -67,18 +52,11 @@ class MatSolidV1(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_base"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatSolidV1."""
-        self.arg_keys = ['solid', 'material']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'solid': 'Expr', 'material': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['solid', 'material']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'solid': 'Expr', 'material': 'Expr'}
 
 @register_node_decorator
 class MatSolidV2(GLNode):
@@ -90,18 +68,11 @@ class MatSolidV2(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_base"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatSolidV2."""
-        self.arg_keys = ['solid', 'material']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'solid': 'Expr', 'material': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['solid', 'material']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'solid': 'Expr', 'material': 'Expr'}
 
 @register_node_decorator
 class MatSolidV3(GLNode):
@@ -113,18 +84,11 @@ class MatSolidV3(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_base"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatSolidV3."""
-        self.arg_keys = ['solid', 'material']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'solid': 'Expr', 'material': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['solid', 'material']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'solid': 'Expr', 'material': 'Expr'}
 
 @register_node_decorator
 class MatSolidV4(GLNode):
@@ -136,18 +100,11 @@ class MatSolidV4(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_base"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatSolidV4."""
-        self.arg_keys = ['solid', 'material']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'solid': 'Expr', 'material': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['solid', 'material']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'solid': 'Expr', 'material': 'Expr'}
 
 @register_node_decorator
 class MatMixV4(GLNode):
@@ -159,18 +116,11 @@ class MatMixV4(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatMixV4."""
-        self.arg_keys = ['expr_a', 'expr_b', 't']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_a': 'Expr', 'expr_b': 'Expr', 't': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_a', 'expr_b', 't']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_a': 'Expr', 'expr_b': 'Expr', 't': 'float'}
 
 @register_node_decorator
 class MatRefV3(GLNode):
@@ -182,18 +132,11 @@ class MatRefV3(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatRefV3."""
-        self.arg_keys = ['name']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'name': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['name']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'name': 'str'}
 
 @register_node_decorator
 class MatRefV4(GLNode):
@@ -205,18 +148,11 @@ class MatRefV4(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatRefV4."""
-        self.arg_keys = ['name']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'name': 'str'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['name']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'name': 'str'}
 
 @register_node_decorator
 class MaterialV1(GLNode):
@@ -228,18 +164,11 @@ class MaterialV1(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MaterialV1."""
-        self.arg_keys = ['smpl_index']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'smpl_index': 'int'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['smpl_index']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'smpl_index': 'int'}
 
 @register_node_decorator
 class MaterialV1V4(GLNode):
@@ -251,18 +180,11 @@ class MaterialV1V4(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MaterialV1V4."""
-        self.arg_keys = ['albedo', 'mr']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'albedo': 'Vector[3]', 'mr': 'Vector[2]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['albedo', 'mr']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'albedo': 'Vector[3]', 'mr': 'Vector[2]'}
 
 @register_node_decorator
 class MaterialV2(GLNode):
@@ -274,18 +196,11 @@ class MaterialV2(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MaterialV2."""
-        self.arg_keys = ['rgb']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'rgb': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['rgb']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'rgb': 'Vector[3]'}
 
 @register_node_decorator
 class MaterialV3(GLNode):
@@ -297,18 +212,11 @@ class MaterialV3(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MaterialV3."""
-        self.arg_keys = ['albedo', 'emissive', 'roughness', 'clearcoat', 'metallic']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'albedo': 'Vector[3]', 'emissive': 'Vector[3]', 'roughness': 'float', 'clearcoat': 'float', 'metallic': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['albedo', 'emissive', 'roughness', 'clearcoat', 'metallic']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'albedo': 'Vector[3]', 'emissive': 'Vector[3]', 'roughness': 'float', 'clearcoat': 'float', 'metallic': 'float'}
 
 @register_node_decorator
 class MaterialV4(GLNode):
@@ -320,18 +228,11 @@ class MaterialV4(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MaterialV4."""
-        self.arg_keys = ['albedo', 'emissive', 'mrc']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'albedo': 'Vector[3]', 'emissive': 'Vector[3]', 'mrc': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['albedo', 'emissive', 'mrc']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'albedo': 'Vector[3]', 'emissive': 'Vector[3]', 'mrc': 'Vector[3]'}
 
 @register_node_decorator
 class NonEmissiveMaterialV3(GLNode):
@@ -343,18 +244,11 @@ class NonEmissiveMaterialV3(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for NonEmissiveMaterialV3."""
-        self.arg_keys = ['albedo', 'roughness', 'clearcoat', 'metallic']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'albedo': 'Vector[3]', 'roughness': 'float', 'clearcoat': 'float', 'metallic': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['albedo', 'roughness', 'clearcoat', 'metallic']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'albedo': 'Vector[3]', 'roughness': 'float', 'clearcoat': 'float', 'metallic': 'float'}
 
 @register_node_decorator
 class RegisterMaterial(GLNode):
@@ -366,18 +260,11 @@ class RegisterMaterial(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_materials"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RegisterMaterial."""
-        self.arg_keys = ['name', 'material']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'name': 'str', 'material': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['name', 'material']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'name': 'str', 'material': 'Expr'}
 
 @register_node_decorator
 class Avoid(GLNode):
@@ -389,18 +276,11 @@ class Avoid(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Avoid."""
-        self.arg_keys = ['expr_0', 'expr_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
 
 @register_node_decorator
 class MatColorOnly(GLNode):
@@ -412,18 +292,11 @@ class MatColorOnly(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatColorOnly."""
-        self.arg_keys = ['expr_0', 'expr_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
 
 @register_node_decorator
 class MatSmoothColorOnly(GLNode):
@@ -435,18 +308,11 @@ class MatSmoothColorOnly(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for MatSmoothColorOnly."""
-        self.arg_keys = ['expr_0', 'expr_1', 'k']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1', 'k']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr', 'k': 'float'}
 
 @register_node_decorator
 class Repel(GLNode):
@@ -458,18 +324,11 @@ class Repel(GLNode):
     # Embed category metadata in the class
     node_category = "sysl_combinators"
     
-    def __init__(self, *args, **kwargs):
-        # Keep super init simple; expr_class is already bound at class-level
-        super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for Repel."""
-        self.arg_keys = ['expr_0', 'expr_1']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    # Socket metadata, shared by all instances
+    arg_keys = ['expr_0', 'expr_1']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr_0': 'Expr', 'expr_1': 'Expr'}
 
 def register_all_nodes() -> List[str]:
     """Return list of all auto-registered SySL nodes."""
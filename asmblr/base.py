@@ -1,6 +1,5 @@
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
 import torch as th
 import numpy as np
 import sympy as sp
@@ -108,10 +107,39 @@ class BaseNode(ABC):
         if self.outputs:
             return self.outputs  # Return cached output if available
         
-        self.resolve_inputs(sketcher, **kwargs)  # Get data from input connections
-        self.inner_eval(sketcher, **kwargs)  # Run node-specific evaluation logic
+        # Evaluate upstream nodes first so that resolving inputs only reads cached outputs
+        for node in self._evaluation_order():
+            node.clean = False
+            if node.outputs:
+                continue
+            node.resolve_inputs(sketcher, **kwargs)  # Get data from input connections
+            node.inner_eval(sketcher, **kwargs)  # Run node-specific evaluation logic
         return self.outputs
     
+    def _evaluation_order(self):
+        """Return the unevaluated nodes this node depends on (and itself) in topological order."""
+        order = []
+        visited = {id(self)}
+        stack = [(self, iter(self.input_sockets.values()))]
+        while stack:
+            node, sockets = stack[-1]
+            upstream = None
+            for socket in sockets:
+                for conn in socket.connections:
+                    input_node = conn.input_node
+                    if id(input_node) not in visited and not input_node.outputs:
+                        visited.add(id(input_node))
+                        upstream = input_node
+                        break
+                if upstream is not None:
+                    break
+            if upstream is None:
+                stack.pop()
+                order.append(node)
+            else:
+                stack.append((upstream, iter(upstream.input_sockets.values())))
+        return order
+    
     def register_input(self, name, value, copy=None):
         """Register an input value for this node."""
         try:
@@ -131,10 +159,7 @@ class BaseNode(ABC):
 
     def register_output(self, name, value):
         """Register an output value for this node."""
-        try:
-            self.outputs[name] = value
-        except Exception as e:
-            raise ValueError(f"Failed to register output '{name}': {str(e)}")
+        self.outputs[name] = value
     
     def socket_request_count(self, socket_name):
         """Get the number of connections for an output socket."""
@@ -144,19 +169,23 @@ class BaseNode(ABC):
             raise KeyError(f"Output socket '{socket_name}' does not exist")
     
     def clean_outputs(self):
-        self.outputs = defaultdict()
+        self.outputs = {}
     
     def clean_inputs(self):
-        self.inputs = defaultdict()
+        self.inputs = {}
     
     def clean_graph(self):
-        if not self.clean:
-            self.clean_outputs()
-            self.clean_inputs()
-            for _, socket in self.input_sockets.items():
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.clean:
+                continue
+            node.clean_outputs()
+            node.clean_inputs()
+            node.clean = True
+            for socket in node.input_sockets.values():
                 for conn in socket.connections:
-                    conn.input_node.clean_graph()
-            self.clean = True
+                    stack.append(conn.input_node)
     
 
     def to_dict(self, device="cpu"):
@@ -167,7 +196,8 @@ class BaseNode(ABC):
         }
         visited_nodes = set()
         node_map = {}
-        traverse_graph(self, visited_nodes, graph_data, node_map, device)
+        value_cache = {}
+        traverse_graph(self, visited_nodes, graph_data, node_map, device, value_cache)
         graph_data = deduplicate_nodes(graph_data)
         return graph_data
 
@@ -387,7 +417,8 @@ class OutputSocket:
         return None
 
 
-def serialize_node(node: 'BaseNode', graph_data: dict, node_map: dict, device: str) -> None:
+def serialize_node(node: 'BaseNode', graph_data: dict, node_map: dict, device: str,
+                   value_cache: Optional[dict] = None) -> None:
     """Serialize a single node and its connections to graph_data.
     
     Args:
@@ -395,6 +426,7 @@ def serialize_node(node: 'BaseNode', graph_data: dict, node_map: dict, device: s
         graph_data: Dictionary to append serialized data to (modified in place).
         node_map: Dictionary mapping node IDs to node instances.
         device: Device to move tensors to ('cpu' or 'cuda').
+        value_cache: Optional per-walk cache so shared tensors are encoded once.
     """
     node_data = {
         "id": node.unique_id,
@@ -409,7 +441,7 @@ def serialize_node(node: 'BaseNode', graph_data: dict, node_map: dict, device: s
                 socket_value = socket_value.cpu() if device == "cpu" else socket_value
             
             # Process the value for JSON serialization
-            data[key] = process_value_for_serialization(socket_value)
+            data[key] = process_value_for_serialization(socket_value, value_cache)
             
     node_data["data"] = data
     graph_data["nodes"].append(node_data)
@@ -427,7 +459,8 @@ def serialize_node(node: 'BaseNode', graph_data: dict, node_map: dict, device: s
             graph_data["connections"].append(connection_data)
 
 
-def traverse_graph(node: 'BaseNode', visited: set, graph_data: dict, node_map: dict, device: str) -> None:
+def traverse_graph(node: 'BaseNode', visited: set, graph_data: dict, node_map: dict, device: str,
+                   value_cache: Optional[dict] = None) -> None:
     """Recursively traverse and serialize a node graph.
     
     Args:
@@ -436,13 +469,14 @@ def traverse_graph(node: 'BaseNode', visited: set, graph_data: dict, node_map: d
         graph_data: Dictionary to append serialized data to (modified in place).
         node_map: Dictionary mapping node IDs to node instances.
         device: Device to move tensors to ('cpu' or 'cuda').
+        value_cache: Optional per-walk cache so shared tensors are encoded once.
     """
     if node.unique_id in visited:
         return
     visited.add(node.unique_id)
-    serialize_node(node, graph_data, node_map, device)
+    serialize_node(node, graph_data, node_map, device, value_cache)
     for socket in node.input_sockets.values():
         if socket.connections:
             for conn in socket.connections:
                 if conn.input_node:
-                    traverse_graph(conn.input_node, visited, graph_data, node_map, device)
+                    traverse_graph(conn.input_node, visited, graph_data, node_map, device, value_cache)
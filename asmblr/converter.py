@@ -1,13 +1,19 @@
 # MAP an expression in GEOLIPI to the corresponding one in SplitWeaver
 # MAP an expresssion in layout to the corresponding one in SplitWeaver
 import torch as th
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, Optional
 import sympy as sp
 import base64
 import geolipi.symbolic as gls
 from geolipi.torch_compute.sympy_to_torch import SYMPY_TO_TEXT
 from .base import BaseNode
-from .simple_registry import NODE_REGISTRY
+from .simple_registry import get_node_class_for_expr
+from . import nodes as anode
+
+# Bytes read per chunk when base64-encoding image files (multiple of 3)
+_IMAGE_CHUNK_SIZE = 57 * 1024
+
 
 def encode_image(image_path: str) -> str:
     """Encode an image file to base64 string.
@@ -18,54 +24,180 @@ def encode_image(image_path: str) -> str:
     Returns:
         Base64 encoded string of the image contents.
     """
+    # Encode in chunks whose size is a multiple of 3, so the concatenated
+    # chunks equal the encoding of the whole file without holding both in memory
+    encoded = bytearray()
     with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
+        for chunk in iter(lambda: image_file.read(_IMAGE_CHUNK_SIZE), b""):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode('utf-8')
   
-def convert_to_asmblr(expr: Any):
-    if isinstance(expr, (int, float, tuple, th.Tensor, sp.Float, sp.Integer, sp.Tuple)):
-        return expr
-    elif (not isinstance(expr, gls.GLFunction)) and isinstance(expr, gls.GLExpr):
+# Values returned unchanged by convert_to_asmblr
+_PASSTHROUGH_TYPES = (int, float, tuple, th.Tensor, sp.Float, sp.Integer, sp.Tuple)
+
+
+def _is_binary_expr(expr: Any) -> bool:
+    """Check whether expr is a non-function GLExpr (converted to a BinaryOperator)."""
+    return (not isinstance(expr, gls.GLFunction)) and isinstance(expr, gls.GLExpr)
+
+
+def _sub_expressions(arg_plan: list) -> list:
+    """Return the planned arguments that must be converted to nodes."""
+    return [arg for arg, converter in arg_plan
+            if converter is None and not isinstance(arg, _PASSTHROUGH_TYPES)]
+
+
+def _convert_symbol(arg: sp.Symbol, expr: Any) -> Any:
+    if hasattr(expr, 'lookup_table') and arg in expr.lookup_table:
+        return expr.lookup_table[arg]
+    return arg.name
+
+
+def _convert_float(arg: sp.Float, expr: Any) -> float:
+    return float(arg)
+
+
+def _convert_integer(arg: sp.Integer, expr: Any) -> int:
+    return int(arg)
+
+
+def _convert_sympy_tuple(arg: sp.Tuple, expr: Any) -> tuple:
+    # Convert sympy Tuple to Python tuple, handling nested values
+    return tuple(float(x) if isinstance(x, sp.Float) else 
+                 int(x) if isinstance(x, sp.Integer) else x 
+                 for x in arg)
+
+
+def _keep_arg(arg: Any, expr: Any) -> Any:
+    return arg
+
+
+# Function arguments stored directly as socket values rather than as nodes,
+# dispatched on their exact type
+_ARG_CONVERTERS = {
+    sp.Symbol: _convert_symbol,
+    sp.Float: _convert_float,
+    sp.Integer: _convert_integer,
+    sp.Tuple: _convert_sympy_tuple,
+    tuple: _keep_arg,
+    int: _keep_arg,
+    float: _keep_arg,
+    bool: _keep_arg,
+    str: _keep_arg,
+}
+# Ordered fallback for subclasses (e.g. sympy's Zero/One integer singletons)
+_ARG_CONVERTER_BASES = (
+    (sp.Symbol, _convert_symbol),
+    (sp.Float, _convert_float),
+    (sp.Integer, _convert_integer),
+    (sp.Tuple, _convert_sympy_tuple),
+    ((int, float, bool, str, tuple), _keep_arg),
+)
+
+
+@lru_cache(maxsize=None)
+def _resolve_arg_converter(arg_type: type):
+    """Resolve the converter for an argument type through its base classes."""
+    for base, candidate in _ARG_CONVERTER_BASES:
+        if issubclass(arg_type, base):
+            return candidate
+    return None
+
+
+def _get_arg_converter(arg: Any):
+    """Get the converter for a primitive argument, or None for sub-expressions."""
+    converter = _ARG_CONVERTERS.get(type(arg))
+    if converter is None:
+        converter = _resolve_arg_converter(type(arg))
+    return converter
+
+
+def _plan_arguments(expr: Any) -> list:
+    """Pair each argument of expr with its primitive converter (None for sub-expressions).
+    
+    The plan is computed once per expression and reused by the build step.
+    """
+    if _is_binary_expr(expr):
+        return [(arg, None) for arg in expr.args[:2]]
+    get_converter = _get_arg_converter
+    return [(arg, get_converter(arg)) for arg in expr.args]
+
+
+def _lookup(arg: Any, converted: dict) -> Any:
+    """Return arg itself for passthrough values, else its already converted node."""
+    if isinstance(arg, _PASSTHROUGH_TYPES):
+        return arg
+    return converted[id(arg)][1]
+
+
+def _build_node(expr: Any, arg_plan: list, converted: dict):
+    """Build the node for expr once all of its sub-expressions are converted."""
+    if _is_binary_expr(expr):
         # A Custom Node. 
         # For now a BinaryGLExpr
-        left = convert_to_asmblr(expr.args[0])
-        right = convert_to_asmblr(expr.args[1])
+        left = _lookup(arg_plan[0][0], converted)
+        right = _lookup(arg_plan[1][0], converted)
         op = SYMPY_TO_TEXT[expr.func]
-        import asmblr.nodes as anode
-        binary_gl_expr = anode.BinaryOperator(left=left.output_sockets['expr'], 
-                                      right=right.output_sockets['expr'], 
-                                      op=op)
-        return binary_gl_expr
-    else:
-        # Get the corresponding node class
-        corresponding_class = NODE_REGISTRY.get(expr.__class__.__name__, None)
-        if corresponding_class is None:
-            raise ValueError(f"Node class {expr.__class__.__name__} not found in NODE_REGISTRY")
-        
-        # Convert arguments to appropriate values/nodes
-        converted_args = []
-        for arg in expr.args:
-            if isinstance(arg, (sp.Symbol, sp.Float, sp.Integer, int, float, bool, str, tuple, sp.Tuple)):
-                # Primitive value - convert to Python types
-                if isinstance(arg, sp.Symbol):
-                    if hasattr(expr, 'lookup_table') and arg in expr.lookup_table:
-                        converted_args.append(expr.lookup_table[arg])
-                    else:
-                        converted_args.append(arg.name)
-                elif isinstance(arg, (sp.Float, sp.Integer)):
-                    converted_args.append(float(arg) if isinstance(arg, sp.Float) else int(arg))
-                elif isinstance(arg, (sp.Tuple, tuple)):
-                    # Convert sympy Tuple to Python tuple, handling nested values
-                    if isinstance(arg, sp.Tuple):
-                        converted_args.append(tuple(float(x) if isinstance(x, sp.Float) else 
-                                                  int(x) if isinstance(x, sp.Integer) else x 
-                                                  for x in arg))
-                    else:
-                        converted_args.append(arg)
-                else:
-                    converted_args.append(arg)
-            else:
-                # Sub-expression - recursively convert to node
-                converted_args.append(convert_to_asmblr(arg))
+        return anode.BinaryOperator(left=left.output_sockets['expr'], 
+                                    right=right.output_sockets['expr'], 
+                                    op=op)
+
+    # Get the corresponding node class
+    corresponding_class = get_node_class_for_expr(type(expr))
+    if corresponding_class is None:
+        raise ValueError(f"Node class {expr.__class__.__name__} not found in NODE_REGISTRY")
+
+    # Convert arguments to appropriate values/nodes
+    converted_args = []
+    append = converted_args.append
+    lookup = _lookup
+    for arg, converter in arg_plan:
+        if converter is not None:
+            # Primitive value - convert to Python types
+            append(converter(arg, expr))
+        else:
+            # Sub-expression - already converted to a node
+            append(lookup(arg, converted))
+
+    # Create node with converted arguments (using the new initialization pattern)
+    return corresponding_class(*converted_args)
+
+
+def convert_to_asmblr(expr: Any, cache: Optional[Dict[int, tuple]] = None):
+    """Convert a GeoLIPI expression into an ASMBLR node DAG.
+    
+    The expression tree is walked iteratively in post-order, so deep
+    expressions do not hit the recursion limit. Sub-expressions that are the
+    same object are converted once and share a single node.
+    
+    Args:
+        expr: GeoLIPI expression (or primitive value) to convert.
+        cache: Optional dict to share converted nodes across calls. It maps
+            id(expr) to (expr, node); holding expr keeps the id valid.
+            Defaults to a fresh cache for each call.
         
-        # Create node with converted arguments (using the new initialization pattern)
-        return corresponding_class(*converted_args)
\ No newline at end of file
+    Returns:
+        The root node of the DAG, or expr itself for primitive values.
+    """
+    if isinstance(expr, _PASSTHROUGH_TYPES):
+        return expr
+
+    converted = {} if cache is None else cache
+    # Stack entries are (expr, arg_plan); the plan is None until expr is expanded
+    todo = [(expr, None)]
+    pop, push = todo.pop, todo.append
+    build_node, sub_expressions, plan_arguments = _build_node, _sub_expressions, _plan_arguments
+    while todo:
+        cur_expr, arg_plan = pop()
+        cur_id = id(cur_expr)
+        if cur_id in converted:
+            continue
+        if arg_plan is not None:
+            converted[cur_id] = (cur_expr, build_node(cur_expr, arg_plan, converted))
+        else:
+            arg_plan = plan_arguments(cur_expr)
+            push((cur_expr, arg_plan))
+            for child in reversed(sub_expressions(arg_plan)):
+                if id(child) not in converted:
+                    push((child, None))
+    return converted[id(expr)][1]
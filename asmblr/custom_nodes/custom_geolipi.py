@@ -3,7 +3,6 @@ Custom geolipi nodes that require special behavior and cannot be auto-generated.
 """
 
 from ..expr_node import GLNode
-from ..base import InputSocket, OutputSocket
 from ..simple_registry import register_node, register_node_decorator
 import sympy as sp
 import torch as th
@@ -13,40 +12,32 @@ import geolipi.symbolic as gls
 
 @register_node_decorator
 class SplitVec2D(GLNode):
-    """Split a 2D vector into its components - requires multiple outputs."""
+    """Split a 2D vector into its components - requires multiple outputs.
+    
+    Wider splitters subclass this and only override `output_keys`, one
+    output socket per component.
+    """
 
     # Embed category metadata in the class
     node_category = "variables"
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.expr_class = gls.VarSplitter
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SplitVec2D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
+    expr_class = gls.VarSplitter
+    arg_keys = ['expr']
+    default_values = {}
+    arg_types = {'expr': 'Expr'}
+    output_keys = ("value_1", "value_2")
 
-    def _create_output_sockets(self):
-        """Create output sockets for SplitVec2D - multiple outputs."""
-        self.output_keys = ["value_1", "value_2"]
-        return {key: OutputSocket(key, parent=self) for key in self.output_keys}
+    # Argument types passed to expr_class as-is; anything else is wrapped in a tuple
+    _PASS_TYPES = (tuple, sp.Symbol, th.Tensor, gls.GLExpr, gls.GLFunction)
 
     def inner_eval(self, sketcher=None, **kwargs):
         """Custom evaluation for vector splitting."""
-        arguments = [self.inputs.get(key, None) for key in self.arg_keys]
-        
-        # Process arguments
-        marked_ind = len(arguments)
-        for ind, arg in enumerate(arguments):
-            if not isinstance(arg, (tuple, sp.Symbol, th.Tensor, gls.GLExpr, gls.GLFunction)):
-                arguments[ind] = (arg,)
+        # Gather arguments up to the first missing input
+        arguments = []
+        for key in self.arg_keys:
+            arg = self.inputs.get(key, None)
             if arg is None:
-                marked_ind = ind
                 break
-        arguments = arguments[:marked_ind]
+            arguments.append(arg if isinstance(arg, self._PASS_TYPES) else (arg,))
         
         # Create output for each component
         for ind, key in enumerate(self.output_keys):
@@ -57,42 +48,10 @@ class SplitVec2D(GLNode):
 @register_node_decorator
 class SplitVec3D(SplitVec2D):
     """Split a 3D vector into its components - requires multiple outputs."""
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.expr_class = gls.VarSplitter
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SplitVec3D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
-    
-    def _create_output_sockets(self):
-        """Create output sockets for SplitVec3D - three outputs."""
-        self.output_keys = ["value_1", "value_2", "value_3"]
-        return {key: OutputSocket(key, parent=self) for key in self.output_keys}
+    output_keys = ("value_1", "value_2", "value_3")
 
 
 @register_node_decorator
 class SplitVec4D(SplitVec2D):
     """Split a 4D vector into its components - requires multiple outputs."""
-        
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.expr_class = gls.VarSplitter
-    
-    def _create_input_sockets(self):
-        """Create input sockets for SplitVec4D."""
-        self.arg_keys = ['expr']
-        self.default_values = {}
-        self.arg_types = {'expr': 'Expr'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
-    
-    def _create_output_sockets(self):
-        """Create output sockets for SplitVec4D - four outputs."""
-        self.output_keys = ["value_1", "value_2", "value_3", "value_4"]
-        return {key: OutputSocket(key, parent=self) for key in self.output_keys}
+    output_keys = ("value_1", "value_2", "value_3", "value_4")
@@ -4,8 +4,9 @@ from ..simple_registry import register_node_decorator
 import geolipi.symbolic as gls
 import sympy as sp
 import torch as th
-from ..base import InputSocket, OutputSocket
-from typing import Dict
+
+# Argument types passed to the expression class without wrapping in a tuple
+_PASSTHROUGH_TYPES = (tuple, str, sp.Symbol, th.Tensor, gls.GLExpr, gls.GLFunction)
 
 # I think it should be the Symbols in MXG -> SOLID. 
 # Extrusion. 
@@ -13,45 +14,29 @@ from typing import Dict
 @register_node_decorator
 class PolyArc2D(GLNode):
     node_category = 'primitives_2d'
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.expr_class = gls.PolyArc2D
-
-
-    def _create_input_sockets(self):
-        """Create input sockets for BoundedSolid."""
-        self.default_values = {}
-        self.arg_keys = ['points']
-        self.arg_types = {'points': 'List[Vector[3]]'}
-        self.is_variadic = False
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
-
+    expr_class = gls.PolyArc2D
+    default_values = {}
+    arg_keys = ['points']
+    arg_types = {'points': 'List[Vector[3]]'}
+    is_variadic = False
 
     def inner_eval(self, sketcher=None, **kwargs):
-        arguments = [self.inputs.get(key, None) for key in self.arg_keys]
-        # IDEA - If anything is none - dont pass anything beyond it.
-        if isinstance(arguments[0], (tuple, sp.Tuple)):
-            # convert to list
-            arguments = [tuple([tuple(x) for x in arguments[0]])]
-        marked_ind = len(arguments)
-        for ind, arg in enumerate(arguments):
-            if not isinstance(arg, (tuple, str, sp.Symbol, th.Tensor, gls.GLExpr, gls.GLFunction)):
-                arguments[ind] = (arg,)
-            if arg is None:
-                marked_ind = ind
-                break
-        arguments = arguments[:marked_ind]
+        # 'points' is the only input; if it is None, pass nothing.
+        points = self.inputs.get('points', None)
+        arguments = []
+        if points is not None:
+            if isinstance(points, (tuple, sp.Tuple)):
+                # convert to list
+                points = tuple([tuple(x) for x in points])
+            elif not isinstance(points, _PASSTHROUGH_TYPES):
+                points = (points,)
+            arguments.append(points)
         expr = self.expr_class(*arguments)
         self.register_output("expr", expr)
 
 @register_node_decorator
 class PolyLine2D(PolyArc2D):
     node_category = 'primitives_2d'
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.expr_class = gls.PolyArc2D
-        
 
 
 @register_node_decorator
@@ -64,28 +49,15 @@ class RegisterGeometry(GLNode):
     # Embed category metadata in the class
     node_category = "mxg"
     
+    arg_keys = ['expr', 'name', 'bbox']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'name': 'str', 'bbox': 'Vector[3]'}
+    output_keys = ("expr", "name", "bbox")
+    
     def __init__(self, *args, **kwargs):
         # Keep super init simple; expr_class is already bound at class-level
         super().__init__(*args, **kwargs)
-    
-    def _create_input_sockets(self):
-        """Create input sockets for RegisterGeometry."""
-        self.arg_keys = ['expr', 'name', 'bbox']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'name': 'str', 'bbox': 'Vector[3]'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
-
-    def _create_output_sockets(self) -> Dict[str, OutputSocket]:
-        """Create output sockets - GLNode typically has one 'expr' output."""
-
-        self.output_sockets = {
-            "expr": OutputSocket("expr", parent=self),
-            "name": OutputSocket("name", parent=self),
-            "bbox": OutputSocket("bbox", parent=self),
-        }
-        return self.output_sockets
 
     def inner_eval(self, sketcher_2d=None, copy=False):
         expr = self.inputs.get('expr', None)
@@ -106,28 +78,16 @@ class RegisterState(GLNode):
     # Embed category metadata in the class
     node_category = "mxg"
     
+    arg_keys = ['expr', 'state']
+    default_values = {}
+    is_variadic = False
+    arg_types = {'expr': 'Expr', 'state': 'float'}
+    output_keys = ("expr", "state")
+    
     def __init__(self, *args, **kwargs):
         # Keep super init simple; expr_class is already bound at class-level
         super().__init__(*args, **kwargs)
     
-    def _create_input_sockets(self):
-        """Create input sockets for RegisterState."""
-        self.arg_keys = ['expr', 'state']
-        self.default_values = {}
-        self.is_variadic = False
-        self.arg_types = {'expr': 'Expr', 'state': 'float'}
-        return {key: InputSocket(key, parent=self, value=self.default_values.get(key, None)) 
-                for key in self.arg_keys}
-
-    def _create_output_sockets(self) -> Dict[str, OutputSocket]:
-        """Create output sockets - GLNode typically has one 'expr' output."""
-
-        self.output_sockets = {
-            "expr": OutputSocket("expr", parent=self),
-            "state": OutputSocket("state", parent=self),
-        }
-        return self.output_sockets
-    
     def inner_eval(self, sketcher_2d=None, copy=False):
         expr = self.inputs.get('expr', None)
         state = self.inputs.get('state', None)
@@ -1,28 +1,53 @@
 
 import torch as th
 import sympy as sp
+from functools import lru_cache
 from typing import Any, Dict
 import geolipi.symbolic as gls
 from .base import BaseNode, Connection, InputSocket, OutputSocket
 
 VALID_INPUT_TYPES = (str, tuple, sp.Tuple, sp.Symbol, th.Tensor, gls.GLExpr, gls.GLFunction)
 
+@lru_cache(maxsize=256)
+def _is_valid_input_type(value_type: type) -> bool:
+    """Whether values of this type are passed to expr_class without tuple-wrapping."""
+    return issubclass(value_type, VALID_INPUT_TYPES)
+
 class GLNode(BaseNode):
-    """Base class for nodes that wrap geometric/symbolic expressions."""
+    """Base class for nodes that wrap geometric/symbolic expressions.
+    
+    Subclasses may declare `arg_keys`, `default_values` and `output_keys` as
+    class attributes; the socket layout is then computed once per class.
+    """
+    
+    # Defaults shared by all instances; subclasses override at class level
+    expr_class = None
+    arg_keys = ()
+    default_values = {}
+    # GLNode typically has one 'expr' output
+    output_keys = ("expr",)
+    # Variadic nodes feed all positional args into their first input socket
+    is_variadic = False
+    # (key, default value) pairs, precomputed for class-level arg_keys
+    _input_socket_spec = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        arg_keys = cls.arg_keys
+        if arg_keys is GLNode.arg_keys:
+            # No class-level layout; sockets follow instance attributes
+            cls._input_socket_spec = None
+        else:
+            default_values = cls.default_values
+            cls._input_socket_spec = tuple(
+                (key, default_values.get(key, None)) for key in arg_keys
+            )
     
     def __init__(self, *args, **kwargs):
         """Initialize GLNode with expression class and arguments."""
-        # Extract GLNode-specific parameters, but preserve existing attributes
+        # Extract GLNode-specific parameters; otherwise the class-level expr_class applies
         if 'expr_class' in kwargs:
             self.expr_class = kwargs.pop('expr_class')
-        elif not hasattr(self, 'expr_class'):
-            self.expr_class = None
-        
-        # Set up argument configuration, preserve existing if set
-        if not hasattr(self, 'arg_keys'):
-            self.arg_keys = []
-        if not hasattr(self, 'default_values'):
-            self.default_values = {}
         
         # Call parent constructor with remaining kwargs
         super().__init__(**kwargs)
@@ -32,19 +57,19 @@ class GLNode(BaseNode):
     
     def _create_input_sockets(self) -> Dict[str, InputSocket]:
         """Create input sockets based on arg_keys."""
-        return {
-            key: InputSocket(key, self.default_values.get(key, None)) 
-            for key in self.arg_keys
-        }
+        spec = self._input_socket_spec
+        if spec is None:
+            spec = [(key, self.default_values.get(key, None)) for key in self.arg_keys]
+        return {key: InputSocket(key, parent=self, value=value) for key, value in spec}
     
     def _create_output_sockets(self) -> Dict[str, OutputSocket]:
-        """Create output sockets - GLNode typically has one 'expr' output."""
-        return {"expr": OutputSocket("expr", parent=self)}
+        """Create output sockets based on output_keys."""
+        return {key: OutputSocket(key, parent=self) for key in self.output_keys}
     
     def _handle_node_arguments(self, args, kwargs):
         """Handle positional and keyword arguments for node connections."""
         # Handle positional arguments
-        if hasattr(self, 'is_variadic') and self.is_variadic and len(args) > 0:
+        if self.is_variadic and len(args) > 0:
             # For variadic nodes, connect all args to the single input socket
             variadic_socket = self.arg_keys[0] if self.arg_keys else 'inputs'
             for arg in args:
@@ -85,15 +110,6 @@ class GLNode(BaseNode):
             # Set direct value (float, tuple, bool, etc.)
             self.input_sockets[socket_name].set_value(value)
     
-    def _get_input_socket_for_index(self, index: int) -> str:
-        """Get the input socket name for a given positional argument index."""
-        if index < len(self.arg_keys):
-            return self.arg_keys[index]
-        elif self.arg_keys:
-            return self.arg_keys[-1]  # Default to last socket for overflow
-        else:
-            return "args"  # Fallback
-
     def inner_eval(self, sketcher=None, **kwargs):
         """Evaluate the GLNode by creating the expression."""
         # Gather arguments from inputs (these should now be evaluated expressions, not nodes)
@@ -103,13 +119,11 @@ class GLNode(BaseNode):
             if arg is None:
                 break
             # For variadic nodes, don't wrap single expressions in tuples
-            if hasattr(self, 'is_variadic') and self.is_variadic:
-                for true_arg in arg:
-                    if not isinstance(true_arg, VALID_INPUT_TYPES):
-                        true_arg = (true_arg,)
-                    arguments.append(true_arg)
+            if self.is_variadic:
+                arguments.extend([true_arg if _is_valid_input_type(type(true_arg)) else (true_arg,)
+                                  for true_arg in arg])
             else:
-                if not isinstance(arg, VALID_INPUT_TYPES):
+                if not _is_valid_input_type(type(arg)):
                     arg = (arg,)
                 arguments.append(arg)
         
@@ -2,62 +2,80 @@
 Simple node inspection utilities for ASMBLR.
 """
 
+import re
 from typing import List, Union, Type
-from .simple_registry import NODE_REGISTRY
+from .expr_node import GLNode
+from .simple_registry import get_sorted_node_names
 
 
-def inspect_node(node_or_class: Union[Type, object]) -> None:
-    """Print basic information about a node class or instance."""
-    # Handle both class and instance
-    if isinstance(node_or_class, type):
+def _uses_class_sockets(node_class: Type) -> bool:
+    """Whether a node class's sockets follow from its class-level metadata."""
+    return (issubclass(node_class, GLNode)
+            and node_class._input_socket_spec is not None
+            and node_class._create_input_sockets is GLNode._create_input_sockets
+            and node_class._create_output_sockets is GLNode._create_output_sockets)
+
+
+def inspect_node_str(node_or_class: Union[Type, object]) -> str:
+    """Format basic information about a node class or instance."""
+    if isinstance(node_or_class, type) and _uses_class_sockets(node_or_class):
+        # Read the socket layout from the class instead of constructing a node
         node_class = node_or_class
-        try:
-            node_instance = node_class()
-        except Exception as e:
-            print(f"{node_class.__name__}: Error creating instance - {e}")
-            return
+        inputs = [key for key, _ in node_class._input_socket_spec]
+        outputs = list(node_class.output_keys)
+        arg_types = getattr(node_class, 'arg_types', {})
+        expr_class = getattr(node_class, 'expr_class', None)
     else:
-        node_instance = node_or_class
+        # Handle both class and instance
+        if isinstance(node_or_class, type):
+            try:
+                node_instance = node_or_class()
+            except Exception as e:
+                return f"{node_or_class.__name__}: Error creating instance - {e}"
+        else:
+            node_instance = node_or_class
         node_class = node_instance.__class__
+        inputs = list(getattr(node_instance, 'input_sockets', None) or {})
+        outputs = list(getattr(node_instance, 'output_sockets', None) or {})
+        arg_types = getattr(node_instance, 'arg_types', {})
+        expr_class = getattr(node_instance, 'expr_class', None)
     
-    print(f"{node_class.__name__}")
+    lines = [f"{node_class.__name__}"]
     
     # Show input sockets with type hints
-    if hasattr(node_instance, 'input_sockets') and node_instance.input_sockets:
-        inputs = list(node_instance.input_sockets.keys())
-        if hasattr(node_instance, 'arg_types') and node_instance.arg_types:
-            input_info = []
-            for inp in inputs:
-                type_hint = node_instance.arg_types.get(inp, 'float')
-                input_info.append(f"{inp}:{type_hint}")
-            print(f"  Inputs: [{', '.join(input_info)}]")
+    if inputs:
+        if arg_types:
+            input_info = [f"{inp}:{arg_types.get(inp, 'float')}" for inp in inputs]
+            lines.append(f"  Inputs: [{', '.join(input_info)}]")
         else:
-            print(f"  Inputs: {inputs}")
+            lines.append(f"  Inputs: {inputs}")
     else:
-        print("  Inputs: []")
+        lines.append("  Inputs: []")
     
     # Show output sockets  
-    if hasattr(node_instance, 'output_sockets') and node_instance.output_sockets:
-        outputs = list(node_instance.output_sockets.keys())
-        print(f"  Outputs: {outputs}")
+    if outputs:
+        lines.append(f"  Outputs: {outputs}")
     else:
-        print("  Outputs: ['expr']")  # Default for most nodes
+        lines.append("  Outputs: ['expr']")  # Default for most nodes
     
     # Show expression class if available
-    if hasattr(node_instance, 'expr_class') and node_instance.expr_class:
-        print(f"  Expression: {node_instance.expr_class.__name__}")
+    if expr_class:
+        lines.append(f"  Expression: {expr_class.__name__}")
+    
+    return "\n".join(lines)
+
+
+def inspect_node(node_or_class: Union[Type, object]) -> None:
+    """Print basic information about a node class or instance."""
+    print(inspect_node_str(node_or_class))
 
 
 def list_nodes() -> List[str]:
     """Get list of all registered node names."""
-    return sorted(NODE_REGISTRY.keys())
+    return list(get_sorted_node_names())
 
 
 def search_nodes(pattern: str) -> List[str]:
     """Search for nodes matching a pattern (case-insensitive)."""
-    import re
     regex = re.compile(pattern, re.IGNORECASE)
-    return sorted([name for name in NODE_REGISTRY.keys() if regex.search(name)])
-
-
-
+    return [name for name in get_sorted_node_names() if regex.search(name)]
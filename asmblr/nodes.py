@@ -22,7 +22,11 @@ def __getattr__(name):
     This uses Python 3.7+ module-level __getattr__ for clean dynamic access.
     """
     if name in NODE_REGISTRY:
-        return NODE_REGISTRY[name]
+        node_class = NODE_REGISTRY[name]
+        # Cache in the module namespace so later lookups skip __getattr__;
+        # register_node keeps the cached entry current on re-registration.
+        globals()[name] = node_class
+        return node_class
     raise AttributeError(f"Node '{name}' not found. Use asmblr.list_nodes() to see available nodes.")
 
 
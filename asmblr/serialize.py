@@ -2,10 +2,188 @@ import torch as th
 from PIL import Image
 from io import BytesIO
 import numpy as np
-import base64
+import binascii
 
 import gzip
-from typing import Any, Dict
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+# Little-endian layouts used by the packed "numeric_array" serialization type
+_NUMERIC_ARRAY_DTYPES = {"int64": "<i8", "float64": "<f8"}
+
+# Shorter numeric sequences keep the plain "tuple" form
+_MIN_PACKED_LEN = 16
+
+# Ints outside this range cannot be packed as int64
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+
+# Array payloads smaller than this are stored uncompressed
+_MIN_COMPRESS_BYTES = 256
+
+# Serialized torch dtype -> numpy dtype used to rebuild the tensor (float32 otherwise)
+_TORCH_DTYPE_TO_NUMPY = {
+    "torch.float32": np.float32,
+    "torch.float64": np.float64,
+    "torch.int32": np.int32,
+    "torch.int64": np.int64,
+    "torch.bool": np.bool_,
+}
+
+def _b64encode(data) -> str:
+    """Base64-encode a bytes-like object to str in a single C call."""
+    return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    """Decode a base64 str produced by _b64encode."""
+    return binascii.a2b_base64(text)
+
+
+@lru_cache(maxsize=None)
+def _torchvision_encode_png():
+    """Return torchvision's native PNG encoder, or None if torchvision is not installed."""
+    try:
+        from torchvision.io import encode_png
+    except ImportError:
+        return None
+    return encode_png
+
+
+@lru_cache(maxsize=None)
+def _zstandard():
+    """Return the zstandard module, or None if it is not installed."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _byte_view(array: np.ndarray) -> np.ndarray:
+    """Flat uint8 view of an array's C-ordered bytes; copies only if non-contiguous."""
+    return np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+
+
+def _compress_bytes(raw):
+    """Compress raw array bytes, returning (codec, base64 string).
+    
+    Uses zstd when the optional zstandard package is installed, gzip otherwise.
+    Small payloads are not worth compressing and are stored as-is.
+    """
+    if len(raw) < _MIN_COMPRESS_BYTES:
+        return "none", _b64encode(raw)
+    zstd = _zstandard()
+    if zstd is not None:
+        return "zstd", _b64encode(zstd.ZstdCompressor(level=3).compress(raw))
+    return "gzip", _b64encode(gzip.compress(raw, compresslevel=1))
+
+
+def _decompress_bytes(data: str, codec: str) -> bytes:
+    """Inverse of _compress_bytes."""
+    compressed = _b64decode(data)
+    if codec == "none":
+        return compressed
+    elif codec == "gzip":
+        return gzip.decompress(compressed)
+    elif codec == "zstd":
+        zstd = _zstandard()
+        if zstd is None:
+            raise ImportError("Decoding zstd-compressed data requires the 'zstandard' package")
+        return zstd.ZstdDecompressor().decompress(compressed)
+    else:
+        raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def _encode_png_bytes(img: np.ndarray) -> bytes:
+    """Encode an (H, W) or (H, W, C) uint8 array as PNG bytes."""
+    encode_png = _torchvision_encode_png()
+    # torchvision's libpng encoder handles grayscale and RGB; use PIL otherwise
+    if encode_png is not None and (img.ndim == 2 or img.shape[-1] == 3):
+        chw = th.from_numpy(img).unsqueeze(0) if img.ndim == 2 else th.from_numpy(img).permute(2, 0, 1)
+        return encode_png(chw.contiguous()).numpy().tobytes()
+    buff = BytesIO()
+    Image.fromarray(img).save(buff, format="PNG")
+    return buff.getvalue()
+
+
+def _encode_image_tensor(socket_value: th.Tensor) -> str:
+    """Encode a 3D image tensor as a base64 PNG data URI.
+    
+    uint8 tensors are used as-is; other dtypes are assumed to be in [0, 1]
+    and are scaled to uint8. Channel-first tensors are moved to HWC.
+    """
+    img_t = socket_value.detach()
+    if img_t.dtype != th.uint8:
+        # Scale on the torch side (and device) so only the uint8 image reaches numpy
+        img_t = img_t.clamp(0, 1).mul_(255).to(th.uint8)
+    img = img_t.cpu().numpy()
+    if img.shape[0] in (1, 3, 4) and img.shape[-1] not in (1, 3, 4):
+        img = np.ascontiguousarray(np.transpose(img, (1, 2, 0)))
+    if img.shape[-1] == 1:
+        img = img[..., 0]
+    new_image_string = _b64encode(_encode_png_bytes(img))
+    return f"data:image/png;base64,{new_image_string}"
+
+
+def _json_compatible_socket(key: str, socket_value):
+    """Convert one socket value, returning the (possibly renamed) key and the value."""
+    if isinstance(socket_value, th.Tensor):
+        socket_value = socket_value.detach().cpu()
+        if len(socket_value.shape) == 0:
+            return key, float(socket_value.item())
+        elif len(socket_value.shape) == 1:
+            # tolist() already yields Python floats for floating dtypes
+            if not socket_value.is_floating_point():
+                socket_value = socket_value.double()
+            return key, tuple(socket_value.tolist())
+        elif len(socket_value.shape) == 3:
+            # Handle image tensors (H, W, C) or (C, H, W)
+            return f"{key}_IMG", _encode_image_tensor(socket_value)
+        else:
+            raise NotImplementedError(
+                f"Tensor with shape {socket_value.shape} not supported. "
+                f"Supported shapes: scalar (0D), vector (1D), image (3D)."
+            )
+    else:
+        raise NotImplementedError(
+            f"Value type {type(socket_value).__name__} not supported in make_json_compatible. "
+            f"Use process_value_for_serialization for general serialization."
+        )
+
+
+def _iter_processed(node_values: Dict[str, Any], encoded_images: Optional[Dict[str, str]] = None):
+    """Yield JSON-compatible (key, value) pairs for a node's socket data.
+    
+    Image sockets found in encoded_images use the pre-encoded data URI.
+    """
+    for key, socket_value in node_values.items():
+        if encoded_images and key in encoded_images:
+            yield f"{key}_IMG", encoded_images[key]
+        else:
+            yield _json_compatible_socket(key, socket_value)
+
+
+def _encode_images_parallel(node_data: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Pre-encode image sockets on a thread pool when a graph has several of them.
+    
+    PNG encoding releases the GIL, so images encode concurrently. Returns one
+    {socket key: data URI} dict per node (empty when encoding stays inline).
+    """
+    encoded = [{} for _ in node_data]
+    images = [(ind, key, value) for ind, node in enumerate(node_data)
+              for key, value in node['data'].items()
+              if isinstance(value, th.Tensor) and len(value.shape) == 3]
+    if len(images) < 2:
+        return encoded
+    max_workers = min(len(images), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        uris = pool.map(_encode_image_tensor, [value for _, _, value in images])
+        for (ind, key, _), uri in zip(images, uris):
+            encoded[ind][key] = uri
+    return encoded
+
 
 def make_json_compatible(graph_data):
     """Convert data to JSON-compatible types.
@@ -17,63 +195,69 @@ def make_json_compatible(graph_data):
         Modified graph_data with JSON-compatible values.
     """
     node_data = graph_data['nodes']
-    compatible_data = []
-    for node in node_data:
-        compatible_node = {}
-        for key, socket_value in node['data'].items():
-            if isinstance(socket_value, th.Tensor):
-                socket_value = socket_value.cpu()
-                if len(socket_value.shape) == 0:
-                    processed = float(socket_value.item())
-                    key_name = key
-                elif len(socket_value.shape) == 1:
-                    new_val = socket_value.cpu().numpy().tolist()
-                    processed = tuple([float(x) for x in new_val])
-                    key_name = key
-                elif len(socket_value.shape) == 3:
-                    # Handle image tensors (H, W, C)
-                    img = socket_value.cpu().numpy()
-                    pil_img = Image.fromarray((img * 255).astype(np.uint8))
-                    buff = BytesIO()
-                    pil_img.save(buff, format="PNG")
-                    new_image_string = base64.b64encode(buff.getvalue()).decode("utf-8")
-                    processed = f"data:image/png;base64,{new_image_string}"
-                    key_name = f"{key}_IMG"
-                else:
-                    raise NotImplementedError(
-                        f"Tensor with shape {socket_value.shape} not supported. "
-                        f"Supported shapes: scalar (0D), vector (1D), image (3D)."
-                    )
-            else:
-                raise NotImplementedError(
-                    f"Value type {type(socket_value).__name__} not supported in make_json_compatible. "
-                    f"Use process_value_for_serialization for general serialization."
-                )
-            socket_value = processed
-            key = key_name
-            compatible_node[key] = socket_value
-        compatible_data.append(compatible_node)
-    graph_data['nodes'] = compatible_data
+    encoded_images = _encode_images_parallel(node_data)
+    graph_data['nodes'] = [dict(_iter_processed(node['data'], images))
+                           for node, images in zip(node_data, encoded_images)]
     return graph_data
 
 
 def deduplicate_nodes(graph_data):
-    
-    node_map = {}
+    """Drop repeated node entries (by id), keeping the first occurrence in order."""
+    seen = set()
+    unique_nodes = []
     for node in graph_data["nodes"]:
         node_id = node["id"]
-        if node_id not in node_map:
-            node_map[node_id] = node
-        else:
-            pass
-    graph_data["nodes"] = list(node_map.values())
-    return graph_data  
+        if node_id in seen:
+            continue
+        seen.add(node_id)
+        unique_nodes.append(node)
+    graph_data["nodes"] = unique_nodes
+    return graph_data
+
+
+def _process_numeric_sequence(value: tuple) -> Dict[str, Any]:
+    """Pack a long tuple of all-int or all-float values into a single base64'd array.
     
-def process_value_for_serialization(value: Any) -> Dict[str, Any]:
+    Short tuples and anything mixed (ints with floats, strings, bools,
+    symbols, ...) keep the plain tuple representation, so element types
+    round-trip unchanged.
+    """
+    if len(value) < _MIN_PACKED_LEN:
+        return {"type": "tuple", "data": value}
+    first_type = type(value[0])
+    if first_type not in (int, float) or any(type(x) is not first_type for x in value):
+        return {"type": "tuple", "data": value}
+    if first_type is int:
+        # Ints int64 can't hold keep the plain tuple form
+        if min(value) < _INT64_MIN or max(value) > _INT64_MAX:
+            return {"type": "tuple", "data": value}
+        dtype = "int64"
+    else:
+        dtype = "float64"
+    # Fixed little-endian layout so payloads are portable across machines
+    packed = np.asarray(value, dtype=_NUMERIC_ARRAY_DTYPES[dtype])
+    return {
+        "type": "numeric_array",
+        "data": _b64encode(packed.tobytes()),
+        "dtype": dtype
+    }
+
+
+def _array_cache_key(value) -> tuple:
+    """Identify an array by the memory it views, so aliases of one buffer share a key."""
+    if isinstance(value, th.Tensor):
+        return ("torch", value.data_ptr(), tuple(value.shape), tuple(value.stride()),
+                value.dtype, value.device)
+    return ("numpy", value.__array_interface__["data"][0], value.shape, value.strides, value.dtype)
+
+
+def process_value_for_serialization(value: Any, cache: Optional[Dict[tuple, tuple]] = None) -> Dict[str, Any]:
     """
     Process a value for JSON serialization.
     
     Returns a dictionary with 'type' and 'data' keys indicating how to reconstruct the value.
+    If a cache dict is given, tensors and arrays that view the same memory are
+    encoded once; create a fresh cache per graph walk.
     """
     if value is None:
         return {"type": "none", "data": None}
@@ -90,38 +274,49 @@ def process_value_for_serialization(value: Any) -> Dict[str, Any]:
     
     elif isinstance(value, (tuple, list)):
         # Keep tuples as tuples, convert lists to tuples
-        return {"type": "tuple", "data": tuple(value)}
+        return _process_numeric_sequence(tuple(value))
     
-    elif isinstance(value, th.Tensor):
-        # Compress torch tensor with gzip
-        tensor_bytes = value.cpu().numpy().tobytes()
-        compressed = gzip.compress(tensor_bytes)
-        encoded = base64.b64encode(compressed).decode('utf-8')
+    elif isinstance(value, (th.Tensor, np.ndarray)):
+        if cache is None:
+            return _process_array(value)
+        key = _array_cache_key(value)
+        entry = cache.get(key, None)
+        if entry is None:
+            # Keep the value alive so its memory (and key) cannot be reused mid-walk
+            entry = (value, _process_array(value))
+            cache[key] = entry
+        return entry[1]
+    
+    else:
+        # Fallback for other types - try to convert to string
+        return {"type": "other", "data": str(value)}
+
+
+def _process_array(value) -> Dict[str, Any]:
+    """Serialize a torch tensor or numpy array as a compressed payload."""
+    if isinstance(value, th.Tensor):
+        # Compress torch tensor (zstd if available, else gzip)
+        codec, encoded = _compress_bytes(_byte_view(value.detach().cpu().numpy()))
         
         return {
             "type": "torch_tensor",
             "data": encoded,
+            "codec": codec,
             "shape": list(value.shape),
             "dtype": str(value.dtype),
             "device": str(value.device)
         }
     
-    elif isinstance(value, np.ndarray):
-        # Compress numpy array with gzip
-        array_bytes = value.tobytes()
-        compressed = gzip.compress(array_bytes)
-        encoded = base64.b64encode(compressed).decode('utf-8')
-        
-        return {
-            "type": "numpy_array", 
-            "data": encoded,
-            "shape": list(value.shape),
-            "dtype": str(value.dtype)
-        }
+    # Compress numpy array (zstd if available, else gzip)
+    codec, encoded = _compress_bytes(_byte_view(value))
     
-    else:
-        # Fallback for other types - try to convert to string
-        return {"type": "other", "data": str(value)}
+    return {
+        "type": "numpy_array", 
+        "data": encoded,
+        "codec": codec,
+        "shape": list(value.shape),
+        "dtype": str(value.dtype)
+    }
 
 
 def unprocess_value_from_serialization(processed_data: Dict[str, Any]) -> Any:
@@ -143,52 +338,39 @@ def unprocess_value_from_serialization(processed_data: Dict[str, Any]) -> Any:
     elif value_type == "tuple":
         return tuple(data)
     
+    elif value_type == "numeric_array":
+        dtype = _NUMERIC_ARRAY_DTYPES[processed_data["dtype"]]
+        array = np.frombuffer(_b64decode(data), dtype=dtype)
+        return tuple(array.tolist())
+    
     elif value_type == "torch_tensor":
-        # Decompress torch tensor
-        compressed = base64.b64decode(data.encode('utf-8'))
-        tensor_bytes = gzip.decompress(compressed)
+        # Decompress torch tensor; payloads without a codec predate zstd support
+        tensor_bytes = _decompress_bytes(data, processed_data.get("codec", "gzip"))
         
         # Reconstruct tensor
         shape = processed_data["shape"]
         dtype_str = processed_data["dtype"]
         
-        # Map string dtype back to torch dtype
-        dtype_map = {
-            "torch.float32": th.float32,
-            "torch.float64": th.float64,
-            "torch.int32": th.int32,
-            "torch.int64": th.int64,
-            "torch.bool": th.bool,
-        }
-        dtype = dtype_map.get(dtype_str, th.float32)
-        
-        # Map torch dtype to numpy dtype
-        numpy_dtype_map = {
-            th.float32: np.float32,
-            th.float64: np.float64,
-            th.int32: np.int32,
-            th.int64: np.int64,
-            th.bool: np.bool_,
-        }
-        numpy_dtype = numpy_dtype_map.get(dtype, np.float32)
+        # Map string torch dtype to the numpy dtype of the stored bytes
+        numpy_dtype = _TORCH_DTYPE_TO_NUMPY.get(dtype_str, np.float32)
         
-        # Create numpy array first, then convert to torch
-        np_array = np.frombuffer(tensor_bytes, dtype=numpy_dtype).reshape(shape)
+        # Create numpy array first, then convert to torch. A bytearray keeps the
+        # buffer writable, so the tensor shares it without read-only warnings.
+        np_array = np.frombuffer(bytearray(tensor_bytes), dtype=numpy_dtype).reshape(shape)
         tensor = th.from_numpy(np_array)
         
         return tensor
     
     elif value_type == "numpy_array":
         # Decompress numpy array
-        compressed = base64.b64decode(data.encode('utf-8'))
-        array_bytes = gzip.decompress(compressed)
+        array_bytes = _decompress_bytes(data, processed_data.get("codec", "gzip"))
         
         # Reconstruct array
         shape = processed_data["shape"]
         dtype_str = processed_data["dtype"]
         
         # Create numpy array
-        array = np.frombuffer(array_bytes, dtype=dtype_str).reshape(shape)
+        array = np.frombuffer(bytearray(array_bytes), dtype=dtype_str).reshape(shape)
         return array
     
     elif value_type == "other":
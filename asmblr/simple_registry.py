@@ -4,16 +4,65 @@ Just a dictionary mapping node names to node classes.
 """
 
 import inspect
+import sys
 from typing import Dict, Type, Callable, List, Any, Optional
 
 # Global registry - simple dictionary like geolipi
 NODE_REGISTRY: Dict[str, Type] = {}
 
+# Expression class -> node class index, consistent with looking up
+# NODE_REGISTRY by the expression class name. Filled at registration for
+# nodes with a matching class-level expr_class, and lazily by get_node_class_for_expr.
+NODE_REGISTRY_BY_TYPE: Dict[Type, Type] = {}
+
+# Bumped on every registration
+_REGISTRY_VERSION = 0
+# Sorted node names, rebuilt lazily when the registry version changes
+_SORTED_NODE_NAMES: Optional[tuple] = None
+_SORTED_NODE_NAMES_VERSION = -1
+
 def register_node(node_class: Type) -> Type:
     """Register a node class in the global registry."""
-    NODE_REGISTRY[node_class.__name__] = node_class
+    global _REGISTRY_VERSION
+    name = node_class.__name__
+    expr_class = getattr(node_class, 'expr_class', None)
+    if expr_class is not None and not callable(expr_class):
+        raise TypeError(f"Node {name} has a non-callable expr_class: {expr_class!r}")
+    previous = NODE_REGISTRY.get(name, None)
+    if previous is not None:
+        # Re-registration: forget expression types resolved to the old node
+        stale = [expr_type for expr_type, cls in NODE_REGISTRY_BY_TYPE.items() if cls is previous]
+        for expr_type in stale:
+            del NODE_REGISTRY_BY_TYPE[expr_type]
+    NODE_REGISTRY[name] = node_class
+    _REGISTRY_VERSION += 1
+    # Refresh the class cached by asmblr.nodes.__getattr__, if any
+    nodes_module = sys.modules.get(__package__ + '.nodes', None)
+    if nodes_module is not None and name in nodes_module.__dict__:
+        setattr(nodes_module, name, node_class)
+    if isinstance(expr_class, type) and expr_class.__name__ == name:
+        NODE_REGISTRY_BY_TYPE[expr_class] = node_class
     return node_class
 
+def get_node_class_for_expr(expr_type: Type) -> Optional[Type]:
+    """Get the node class for an expression class, or None if not registered."""
+    node_class = NODE_REGISTRY_BY_TYPE.get(expr_type, None)
+    if node_class is None:
+        node_class = NODE_REGISTRY.get(expr_type.__name__, None)
+        if node_class is not None:
+            NODE_REGISTRY_BY_TYPE[expr_type] = node_class
+    return node_class
+
+def get_sorted_node_names() -> tuple:
+    """Get all registered node names in sorted order."""
+    global _SORTED_NODE_NAMES, _SORTED_NODE_NAMES_VERSION
+    # The length check also catches entries added or removed on NODE_REGISTRY directly
+    if (_SORTED_NODE_NAMES_VERSION != _REGISTRY_VERSION
+            or len(_SORTED_NODE_NAMES) != len(NODE_REGISTRY)):
+        _SORTED_NODE_NAMES = tuple(sorted(NODE_REGISTRY.keys()))
+        _SORTED_NODE_NAMES_VERSION = _REGISTRY_VERSION
+    return _SORTED_NODE_NAMES
+
 def register_node_decorator(node_class: Type) -> Type:
     """Decorator to register a node class in the global registry."""
     return register_node(node_class)
\ No newline at end of file
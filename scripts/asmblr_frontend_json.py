@@ -14,9 +14,9 @@ Usage:
 import argparse
 import json
 import os
+from functools import lru_cache
 from typing import Any, Dict, List
 
-from asmblr.auto_loader import load_all_geolipi_nodes, load_all_sysl_nodes  # noqa: F401 (ensures registry is populated)
 from asmblr.simple_registry import NODE_REGISTRY
 
 
@@ -31,11 +31,13 @@ EXCLUDE_SYMBOLS = {
     "SquiggleRadial2D", "SquiggleDistortion2D",
     "EncodedLowPrecisionSDFGrid3D", "EncodedSDFGrid3D", "LowPrecisionSDFGrid3D"
 }
-# Expression type prefixes
-EXPR_TYPE_PREFIXES = ('expr', 'expr[')
+# Expression type prefix (covers both 'expr' and 'expr[...]')
+EXPR_TYPE_PREFIX = 'expr'
 
 
+@lru_cache(maxsize=None)
 def _get_spec(expr_class) -> Dict[str, Any]:
+    # Cached per expr_class; several nodes can share one and the spec is read-only here.
     # Prefer default_specs (plural) if available; else default_spec
     spec = None
     if hasattr(expr_class, 'default_specs') and callable(expr_class.default_specs):
@@ -53,13 +55,57 @@ def _get_spec(expr_class) -> Dict[str, Any]:
     return spec
 
 
-def _is_expr_type(type_str: str) -> bool:
-    """Check if a type string represents an expression type."""
-    normalized_type = (type_str or '').lower()
-    return normalized_type.startswith(EXPR_TYPE_PREFIXES)
-
+@lru_cache(maxsize=None)
+def _humanize_label(key: str) -> str:
+    """Turn a spec key like 'num_points' into a UI label like 'Num Points'."""
+    return key.replace('_', ' ').title()
 
 
+def _is_expr_type(type_str: str) -> bool:
+    """Check if a type string represents an expression type."""
+    return bool(type_str) and type_str.lower().startswith(EXPR_TYPE_PREFIX)
+
+
+@lru_cache(maxsize=None)
+def _instance_expr_class(node_cls) -> Any:
+    """expr_class set by a node's constructor, or None if it cannot be built (cached per class)."""
+    try:
+        return getattr(node_cls(), 'expr_class', None)
+    except Exception:
+        return None
+
+
+def _parse_entry(key: str, entry: Any) -> tuple:
+    """Read a spec entry once: (key, type string, default, variadic, is expression)."""
+    if not isinstance(entry, dict):
+        return key, '', None, False, False
+    type_str = entry.get('type', '')
+    return key, type_str, entry.get('default', None), bool(entry.get('variadic', False)), _is_expr_type(type_str)
+
+
+def _make_input(key: str, is_expr: bool, variadic: bool) -> Dict[str, Any]:
+    """Input socket entry; expression-typed inputs are required, others are optional."""
+    return {
+        'key': key,
+        'label': _humanize_label(key),
+        'required': is_expr,
+        'variadic': variadic
+    }
+
+
+def _make_control(key: str, type_str: str, default_val: Any) -> Dict[str, Any]:
+    """Control entry linked to the input socket of the same key."""
+    return {
+        'key': key,
+        'type': type_str,
+        'label': _humanize_label(key),
+        'linkedToInput': key,
+        'hasSocket': True,
+        'config': {
+            'defaultValue': default_val
+        },
+        'showLabel': True
+    }
 
 
 def build_nodes_payload() -> Dict[str, Any]:
@@ -73,46 +119,14 @@ def build_nodes_payload() -> Dict[str, Any]:
 
         # Fallback: try instance-level expr_class if class-level missing
         if (not spec) and (expr_class is None):
-            try:
-                inst = node_cls()
-                expr_class = getattr(inst, 'expr_class', None)
-                spec = _get_spec(expr_class) if expr_class is not None else {}
-            except Exception:
-                spec = {}
-
-        inputs: List[Dict[str, Any]] = []
-        controls: List[Dict[str, Any]] = []
-
-        for key, entry in spec.items():
-            entry = entry if isinstance(entry, dict) else {}
-            type_str = entry.get('type', '')
-            default_val = entry.get('default', None)
-            variadic = bool(entry.get('variadic') or entry.get('variadic') or False)
-            if _is_expr_type(type_str):
-                inputs.append({
-                    'key': key,
-                    'label': key.replace('_', ' ').title(),
-                    'required': True,
-                    'variadic': variadic
-                })
-            else:
-                inputs.append({
-                    'key': key,
-                    'label': key.replace('_', ' ').title(),
-                    'required': False,
-                    'variadic': variadic
-                })
-                controls.append({
-                    'key': key,
-                    'type': type_str,
-                    'label': key.replace('_', ' ').title(),
-                    'linkedToInput': key,
-                    'hasSocket': True,
-                    'config': {
-                        'defaultValue': default_val
-                    },
-                    'showLabel': True
-                })
+            expr_class = _instance_expr_class(node_cls)
+            spec = _get_spec(expr_class) if expr_class is not None else {}
+
+        params = [_parse_entry(key, entry) for key, entry in spec.items()]
+        inputs = [_make_input(key, is_expr, variadic)
+                  for key, _, _, variadic, is_expr in params]
+        controls = [_make_control(key, type_str, default_val)
+                    for key, type_str, default_val, _, is_expr in params if not is_expr]
 
         # Get category from node class metadata (embedded during auto-generation)
         category = getattr(node_cls, 'node_category', 'auto')
@@ -134,6 +148,15 @@ def build_nodes_payload() -> Dict[str, Any]:
     return { 'nodes': nodes }
 
 
+def _dump_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize the payload as indented JSON, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(payload, indent=2).encode('utf-8')
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--out', type=str, default='./nodes.json')
@@ -141,9 +164,11 @@ def main():
 
     payload = build_nodes_payload()
     out_path = args.out
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    with open(out_path, 'w') as f:
-        json.dump(payload, f, indent=2)
+    out_dir = os.path.dirname(out_path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    with open(out_path, 'wb', buffering=1 << 16) as f:
+        f.write(_dump_json(payload))
     print(f"Wrote nodes JSON: {out_path} ({len(payload.get('nodes', []))} nodes)")
 
 
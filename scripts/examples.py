@@ -8,6 +8,9 @@ This file demonstrates how to:
 4. Inspect nodes and their properties
 """
 
+import os
+import traceback
+
 import asmblr.nodes as anode
 import asmblr
 import geolipi.symbolic as gls
@@ -58,7 +61,7 @@ def example_2_geolipi_conversion():
     recovered_expr = asmblr_dag.outputs['expr']
     
     print(f"✅ Recovered expression: {recovered_expr}")
-    print(f"   Original == Recovered: {str(geolipi_expr) == str(recovered_expr)}")
+    print(f"   Original == Recovered: {geolipi_expr == recovered_expr}")
     
     return asmblr_dag
 
@@ -178,12 +181,14 @@ def example_6_node_search_and_discovery():
     print(f"First 10 nodes: {all_nodes[:10]}")
     
     # Inspect a few different types
-    print(f"\n📋 Sample Node Types:")
+    # Build the whole report first and print it once
+    report = ["\n📋 Sample Node Types:"]
     sample_types = ['Translate3D', 'SmoothUnion', 'RoundedBox2D']
     for node_name in sample_types:
         if hasattr(anode, node_name):
-            print(f"\n{node_name}:")
-            asmblr.inspect_node(getattr(anode, node_name))
+            report.append(f"\n{node_name}:")
+            report.append(asmblr.inspect_node_str(getattr(anode, node_name)))
+    print("\n".join(report))
 
 
 def example_7_variadic_union():
@@ -226,16 +231,19 @@ def run_all_examples():
         example_7_variadic_union
     ]
     
-    results = []
-    for example_func in examples:
+    # One slot per example; a failed example leaves None in its slot
+    results = [None] * len(examples)
+    for i, example_func in enumerate(examples):
         try:
-            result = example_func()
-            results.append(result)
+            results[i] = example_func()
             print("\n" + "─" * 60)
         except Exception as e:
             print(f"❌ Error in {example_func.__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            # Full traceback only when debugging
+            if os.environ.get('ASMBLR_DEBUG') == '1':
+                traceback.print_exc()
+            else:
+                print("".join(traceback.format_exception_only(type(e), e)), end="")
     
     print(f"\n🎉 Completed {len(examples)} examples!")
     return results
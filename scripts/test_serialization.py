@@ -5,14 +5,19 @@ This script tests the updated to_dict and from_dict methods with proper data pro
 for different value types including floats, tuples, torch tensors, and numpy arrays.
 """
 
+import os
 import sys
 import json
+import traceback
 import numpy as np
 import torch as th
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEST_JSON_PATH = Path("test_dag.json")
+
 # Add parent directory to path for local development
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(REPO_ROOT))
 
 import asmblr
 import asmblr.nodes as anode
@@ -60,12 +65,9 @@ def test_tensor_serialization():
     torch_tensor = th.randn(3, 4)
     numpy_array = np.random.randn(2, 5)
     
-    # Create a node and manually set tensor values
-    sphere = anode.Sphere3D()
-    sphere.input_sockets['radius'].set_value(torch_tensor)
-    
-    box = anode.Box3D()
-    box.input_sockets['size'].set_value(numpy_array)
+    # Create nodes with tensor values passed straight to the constructor
+    sphere = anode.Sphere3D(radius=torch_tensor)
+    box = anode.Box3D(size=numpy_array)
     
     # Test serialization
     sphere_dict = sphere.to_dict()
@@ -84,9 +86,9 @@ def test_tensor_serialization():
     print(f"✅ Tensor shape: {torch_tensor.shape} -> {restored_tensor.shape}")
     print(f"✅ Array shape: {numpy_array.shape} -> {restored_array.shape}")
     
-    # Verify data integrity
-    assert th.allclose(torch_tensor, restored_tensor, atol=1e-6)
-    assert np.allclose(numpy_array, restored_array, atol=1e-6)
+    # Verify data integrity (the byte-level round-trip is lossless)
+    assert th.equal(torch_tensor, restored_tensor)
+    assert np.array_equal(numpy_array, restored_array)
     
     print("✅ Tensor/array serialization test passed!")
     return restored_tensor, restored_array
@@ -128,7 +130,7 @@ def test_complex_dag_serialization():
     
     print(f"✅ Original result: {original_result}")
     print(f"✅ Restored result: {restored_result}")
-    print(f"✅ Results match: {str(original_result) == str(restored_result)}")
+    print(f"✅ Results match: {original_result == restored_result}")
     
     print("✅ Complex DAG serialization test passed!")
     return restored_dag
@@ -147,9 +149,9 @@ def test_json_compatibility():
     dag_dict = asmblr_dag.to_dict()
     
     # Save to JSON file
-    json_file = Path("test_dag.json")
+    json_file = TEST_JSON_PATH
     with open(json_file, 'w') as f:
-        json.dump(dag_dict, f, indent=2)
+        json.dump(dag_dict, f, separators=(',', ':'))
     
     print(f"✅ Saved DAG to {json_file}")
     print(f"   File size: {json_file.stat().st_size} bytes")
@@ -170,6 +172,7 @@ def test_json_compatibility():
     
     print(f"✅ Original: {original_expr}")
     print(f"✅ Restored: {restored_expr}")
+    print(f"✅ Results match: {original_expr == restored_expr}")
     
     # Clean up
     json_file.unlink()
@@ -178,6 +181,57 @@ def test_json_compatibility():
     return restored_dag
 
 
+def _verify_number(original, restored):
+    # Numbers (but not bools) should become tuples
+    assert restored == (original,)
+    print(f"  ✅ Number converted to tuple correctly")
+
+
+def _verify_list(original, restored):
+    # Lists should become tuples
+    assert restored == tuple(original)
+    print(f"  ✅ List converted to tuple correctly")
+
+
+def _verify_tensor(original, restored):
+    # Tensors should be restored bit-for-bit
+    assert th.equal(original, restored)
+    print(f"  ✅ Tensor restored correctly")
+
+
+def _verify_array(original, restored):
+    # Arrays should be restored bit-for-bit
+    assert np.array_equal(original, restored)
+    print(f"  ✅ Array restored correctly")
+
+
+def _verify_tuple(original, restored):
+    # Tuples should be exactly equal, element types included (2 must not become 2.0)
+    assert original == restored
+    assert [type(x) for x in original] == [type(x) for x in restored]
+    print(f"  ✅ Tuple restored exactly")
+
+
+def _verify_exact(original, restored):
+    # Other types (bool, str, None) should be exactly equal
+    assert original == restored
+    print(f"  ✅ Value restored exactly")
+
+
+# Keyed on exact type, so bool maps to its own entry rather than int's
+_VALUE_VERIFIERS = {
+    int: _verify_number,
+    float: _verify_number,
+    list: _verify_list,
+    th.Tensor: _verify_tensor,
+    np.ndarray: _verify_array,
+    bool: _verify_exact,
+    str: _verify_exact,
+    tuple: _verify_tuple,
+    type(None): _verify_exact,
+}
+
+
 def test_value_processing_functions():
     """Test the individual value processing functions."""
     print("\n🔧 Test 5: Value Processing Functions")
@@ -189,6 +243,13 @@ def test_value_processing_functions():
     test_values = [
         1.5,                    # float -> tuple
         (1.0, 2.0, 3.0),       # tuple -> tuple
+        (2, 2, 2),             # int tuple -> tuple (ints preserved)
+        (2, 0.5),              # mixed int/float tuple -> tuple (ints stay ints)
+        (2**60 + 1, 0.5),      # large int with a float -> tuple (exact int kept)
+        tuple(range(32)),      # long int tuple -> packed int64 array
+        tuple(i / 4 for i in range(32)),  # long float tuple -> packed float64 array
+        (2**63,) * 32,         # long tuple of ints beyond int64 -> tuple (kept unpacked)
+        ("a", 1.0),            # mixed tuple -> tuple
         [4.0, 5.0],            # list -> tuple
         "hello",               # string -> string
         True,                  # bool -> bool
@@ -209,27 +270,8 @@ def test_value_processing_functions():
         restored = unprocess_value_from_serialization(processed)
         print(f"  Restored: {restored} ({type(restored).__name__})")
         
-        # Verify correctness
-        if isinstance(original_value, (int, float)) and not isinstance(original_value, bool):
-            # Numbers (but not bools) should become tuples
-            assert restored == (original_value,)
-            print(f"  ✅ Number converted to tuple correctly")
-        elif isinstance(original_value, list):
-            # Lists should become tuples
-            assert restored == tuple(original_value)
-            print(f"  ✅ List converted to tuple correctly")
-        elif isinstance(original_value, th.Tensor):
-            # Tensors should be approximately equal
-            assert th.allclose(original_value, restored, atol=1e-6)
-            print(f"  ✅ Tensor restored correctly")
-        elif isinstance(original_value, np.ndarray):
-            # Arrays should be approximately equal
-            assert np.allclose(original_value, restored, atol=1e-6)
-            print(f"  ✅ Array restored correctly")
-        else:
-            # Other types (bool, str, None, tuple) should be exactly equal
-            assert original_value == restored
-            print(f"  ✅ Value restored exactly")
+        # Verify correctness with the checker for this exact type
+        _VALUE_VERIFIERS[type(original_value)](original_value, restored)
     
     print("\n✅ Value processing functions test passed!")
 
@@ -253,8 +295,11 @@ def run_all_tests():
         
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        # Full traceback only when debugging
+        if os.environ.get('ASMBLR_DEBUG') == '1':
+            traceback.print_exc()
+        else:
+            print("".join(traceback.format_exception_only(type(e), e)), end="")
 
 
 if __name__ == "__main__":